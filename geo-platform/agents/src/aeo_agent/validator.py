@@ -2,13 +2,127 @@
 AEO Agent Validator - Validates generated schema markup and optimizations.
 """
 
+import asyncio
+import functools
+import hashlib
 import json
 import re
-from typing import Dict, Any, List, Optional, Tuple
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Dict, Any, List, Mapping, Optional, Sequence, Tuple
 from urllib.parse import urlparse
 from ..shared.models import WebsiteData
 from ..shared.llm_client import LLMClient
 
+try:
+    import orjson
+    _json_loads = orjson.loads  # orjson.JSONDecodeError subclasses json.JSONDecodeError
+except ImportError:  # optional speedup; stdlib json is used otherwise
+    orjson = None
+    _json_loads = json.loads
+
+
+# Validation rules are identical for every validator, so build them once;
+# every level is read-only because all instances share the same objects
+_VALIDATION_RULES = MappingProxyType({
+    "schema_required_properties": MappingProxyType({
+        "Organization": ("@context", "@type", "name", "url"),
+        "LocalBusiness": ("@context", "@type", "name", "address", "telephone"),
+        "FAQ": ("@context", "@type", "mainEntity"),
+        "Event": ("@context", "@type", "name", "startDate"),
+        "Product": ("@context", "@type", "name", "description")
+    }),
+    "meta_tag_limits": MappingProxyType({
+        "title_min": 30,
+        "title_max": 60,
+        "description_min": 120,
+        "description_max": 160
+    }),
+    "quality_thresholds": MappingProxyType({
+        "schema_completeness": 0.6,
+        "content_clarity": 0.7,
+        "implementation_feasibility": 0.6
+    })
+})
+
+_LLM_VALIDATE_PROMPT = """
+        Validate this {schema_type} schema markup for quality, correctness, and best practices.
+
+        Schema:
+        {schema_json}
+
+        Check for:
+        1. Schema.org compliance
+        2. Property completeness and accuracy
+        3. Data quality and consistency
+        4. Best practices adherence
+        5. Potential SEO impact
+
+        Return JSON:
+        {{
+            "has_issues": false,
+            "quality_rating": "excellent|good|fair|poor",
+            "suggestions": ["list of specific improvement suggestions"],
+            "seo_impact": "high|medium|low"
+        }}
+        """
+
+# Messages for unmet schema requirements
+_MISSING_TMPL = "Missing %s"
+_MISSING_PROPERTY_TMPL = "Missing required property: %s"
+
+# Matches the same substrings the old per-word `in` checks did
+_ACTIONABLE_RE = re.compile(r"add|use|break|create|implement", re.IGNORECASE)
+
+
+@dataclass(slots=True)
+class SchemaContentValidation:
+    """Content scores for a single schema, used inside validate_schema_markup."""
+    quality_score: float = 0.0
+    completeness_score: float = 0.0
+    warnings: List[str] = field(default_factory=list)
+
+
+def _dumps_indented(data: Any) -> str:
+    """Serialize data as 2-space indented JSON, using orjson when installed."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
+        except TypeError:
+            pass  # e.g. non-str keys; let stdlib json handle or report it
+    return json.dumps(data, indent=2)
+
+
+def _schema_cache_key(schema_data: Any, schema_type: str) -> bytes:
+    """Hash a schema's canonical JSON form for use as a cache key."""
+    if orjson is not None:
+        try:
+            canonical = orjson.dumps(schema_data, option=orjson.OPT_SORT_KEYS)
+        except TypeError:
+            canonical = json.dumps(schema_data, sort_keys=True).encode()
+    else:
+        canonical = json.dumps(schema_data, sort_keys=True).encode()
+    return hashlib.blake2b(schema_type.encode() + b"\0" + canonical, digest_size=16).digest()
+
+
+def _parse_llm_json(response: str) -> Dict[str, Any]:
+    """Parse the JSON object in an LLM reply, ignoring surrounding prose or code fences."""
+    start = response.find("{")
+    end = response.rfind("}")
+    payload = response[start:end + 1] if 0 <= start < end else response
+    return _json_loads(payload)
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_requirement(requirement: str) -> Tuple[str, str]:
+    """Split a requirement into its kind and the property it checks."""
+    if "with at least one" in requirement:
+        # e.g. "mainEntity with at least one Question"
+        return "min_one", requirement.split()[0]
+    return "required", requirement
+
 
 class AEOValidator:
     """
@@ -22,9 +136,71 @@ class AEOValidator:
     - Implementation feasibility
     """
 
+    # Fixed scores returned by the leaf validators; shared read-only mappings
+    _SEMANTIC_RESULT = MappingProxyType({
+        "actionability_score": 0.8  # Default high score for semantic improvements
+    })
+    _ACCESSIBILITY_RESULT = MappingProxyType({
+        "actionability_score": 0.9  # Default high score for accessibility improvements
+    })
+    _HEADING_RESULT = MappingProxyType({
+        "feasibility": 0.9,  # Heading fixes are usually easy to implement
+        "impact": 0.8       # High impact on SEO and accessibility
+    })
+    _ORGANIZATION_RESULT = MappingProxyType({
+        "feasibility": 0.6,  # May require more work
+        "impact": 0.7       # Good impact on user experience
+    })
+    _READABILITY_RESULT = MappingProxyType({
+        "feasibility": 0.7,  # Moderate effort to implement
+        "impact": 0.6       # Moderate impact on user experience
+    })
+
+    # Required Open Graph tags, ordered for warning messages
+    _REQUIRED_OG_TAGS = ("og:title", "og:description", "og:url", "og:type")
+    _REQUIRED_OG_TAG_SET = frozenset(_REQUIRED_OG_TAGS)
+
+    # Upper bound in seconds on waiting for the LLM schema review
+    _LLM_VALIDATION_TIMEOUT = 30
+
+    # LRU bounds for cached LLM schema reviews (entries, seconds)
+    _LLM_CACHE_SIZE = 512
+    _LLM_CACHE_TTL = 3600
+
+    # Shared results for checks that pass without errors or warnings
+    _VALID_STRUCTURE_RESULT = MappingProxyType({"structure_valid": True, "errors": (), "warnings": ()})
+    _VALID_META_RESULT = MappingProxyType({"is_valid": True, "issues": (), "warnings": ()})
+
+    # Fixed attributes live in slots with no per-instance __dict__; patch methods on
+    # the class (before construction for the dispatch tables built in __init__).
+    __slots__ = (
+        "llm_client", "validation_rules", "_specific_dispatch", "_llm_cache",
+        "_actionability_pipeline", "_structure_pipeline",
+        "_title_min", "_title_max", "_desc_min", "_desc_max"
+    )
+
     def __init__(self, llm_client: Optional[LLMClient] = None):
         self.llm_client = llm_client or LLMClient()
-        self.validation_rules = self._load_validation_rules()
+        self.validation_rules = _VALIDATION_RULES
+        self._llm_cache = OrderedDict()
+        meta_limits = self.validation_rules["meta_tag_limits"]
+        self._title_min, self._title_max = meta_limits["title_min"], meta_limits["title_max"]
+        self._desc_min, self._desc_max = meta_limits["description_min"], meta_limits["description_max"]
+        self._specific_dispatch = {
+            "Organization": self._validate_organization_schema,
+            "LocalBusiness": self._validate_local_business_schema
+        }
+        # (package key, validator, weight) stages scored by the validate_* methods
+        self._actionability_pipeline = (
+            ("content_restructuring", self._validate_restructuring_recommendations, 0.3),
+            ("semantic_improvements", self._validate_semantic_improvements, 0.4),
+            ("accessibility_enhancements", self._validate_accessibility_enhancements, 0.3)
+        )
+        self._structure_pipeline = (
+            ("heading_structure_fixes", self._validate_heading_fixes, 0.4),
+            ("content_organization", self._validate_content_organization, 0.3),
+            ("readability_improvements", self._validate_readability_improvements, 0.3)
+        )
 
     async def validate_schema_markup(self, schema_package: Dict[str, Any]) -> Dict[str, Any]:
         """Validate complete schema markup package."""
@@ -40,16 +216,20 @@ class AEOValidator:
         try:
             schema_json = schema_package.get("json_ld", {})
             schema_type = schema_package.get("schema_type", "Unknown")
+            if isinstance(schema_json, (str, bytes)):
+                schema_json = _json_loads(schema_json)
 
             # Basic structure validation
             structure_validation = self._validate_schema_structure(schema_json, schema_type)
-            validation_result.update(structure_validation)
+            validation_result["structure_valid"] = structure_validation["structure_valid"]
+            validation_result["errors"].extend(structure_validation["errors"])
+            validation_result["warnings"].extend(structure_validation["warnings"])
 
             # Content validation
             content_validation = self._validate_schema_content(schema_json, schema_type)
-            validation_result["quality_score"] = content_validation["quality_score"]
-            validation_result["completeness_score"] = content_validation["completeness_score"]
-            validation_result["warnings"].extend(content_validation["warnings"])
+            validation_result["quality_score"] = content_validation.quality_score
+            validation_result["completeness_score"] = content_validation.completeness_score
+            validation_result["warnings"].extend(content_validation.warnings)
 
             # Requirements validation
             requirements_validation = self._validate_requirements(schema_json, schema_package.get("validation_requirements", []))
@@ -57,9 +237,14 @@ class AEOValidator:
                 validation_result["errors"].extend(requirements_validation["missing_requirements"])
                 validation_result["is_valid"] = False
 
-            # LLM-enhanced validation if available
+            # LLM-enhanced validation if available; only schemas that passed the local checks pay for it
             if self.llm_client and validation_result["is_valid"]:
-                llm_validation = await self._llm_validate_schema(schema_json, schema_type)
+                try:
+                    llm_validation = await asyncio.wait_for(
+                        self._llm_validate_schema(schema_json, schema_type), timeout=self._LLM_VALIDATION_TIMEOUT
+                    )
+                except asyncio.TimeoutError:
+                    llm_validation = {"has_issues": False, "quality_rating": "good", "suggestions": [], "error": "LLM validation timed out"}
                 validation_result["llm_feedback"] = llm_validation
 
                 # Adjust scores based on LLM feedback
@@ -130,23 +315,13 @@ class AEOValidator:
             qa_validation = self._validate_qa_content(qa_content["qa_sections"])
             validation_result["quality_score"] += qa_validation["quality_score"] * 0.4
 
-        # Validate content restructuring recommendations
-        restructuring = optimization_package.get("content_restructuring", [])
-        if restructuring:
-            restructuring_validation = self._validate_restructuring_recommendations(restructuring)
-            validation_result["actionability_score"] += restructuring_validation["actionability_score"] * 0.3
-
-        # Validate semantic improvements
-        semantic = optimization_package.get("semantic_improvements", [])
-        if semantic:
-            semantic_validation = self._validate_semantic_improvements(semantic)
-            validation_result["actionability_score"] += semantic_validation["actionability_score"] * 0.4
-
-        # Validate accessibility enhancements
-        accessibility = optimization_package.get("accessibility_enhancements", [])
-        if accessibility:
-            accessibility_validation = self._validate_accessibility_enhancements(accessibility)
-            validation_result["actionability_score"] += accessibility_validation["actionability_score"] * 0.3
+        # Validate restructuring, semantic and accessibility recommendations
+        actionability = 0.0
+        for key, validator, weight in self._actionability_pipeline:
+            items = optimization_package.get(key)
+            if items:
+                actionability += validator(items)["actionability_score"] * weight
+        validation_result["actionability_score"] = actionability
 
         # Normalize scores
         validation_result["quality_score"] = min(validation_result["quality_score"], 1.0)
@@ -163,26 +338,17 @@ class AEOValidator:
             "warnings": []
         }
 
-        # Validate heading fixes
-        heading_fixes = improvements.get("heading_structure_fixes", [])
-        if heading_fixes:
-            heading_validation = self._validate_heading_fixes(heading_fixes)
-            validation_result["implementation_feasibility"] += heading_validation["feasibility"] * 0.4
-            validation_result["impact_score"] += heading_validation["impact"] * 0.4
-
-        # Validate content organization
-        organization = improvements.get("content_organization", [])
-        if organization:
-            org_validation = self._validate_content_organization(organization)
-            validation_result["implementation_feasibility"] += org_validation["feasibility"] * 0.3
-            validation_result["impact_score"] += org_validation["impact"] * 0.3
-
-        # Validate readability improvements
-        readability = improvements.get("readability_improvements", [])
-        if readability:
-            readability_validation = self._validate_readability_improvements(readability)
-            validation_result["implementation_feasibility"] += readability_validation["feasibility"] * 0.3
-            validation_result["impact_score"] += readability_validation["impact"] * 0.3
+        # Validate heading, organization and readability improvements
+        feasibility = 0.0
+        impact = 0.0
+        for key, validator, weight in self._structure_pipeline:
+            items = improvements.get(key)
+            if items:
+                scores = validator(items)
+                feasibility += scores["feasibility"] * weight
+                impact += scores["impact"] * weight
+        validation_result["implementation_feasibility"] = feasibility
+        validation_result["impact_score"] = impact
 
         # Normalize scores
         validation_result["implementation_feasibility"] = min(validation_result["implementation_feasibility"], 1.0)
@@ -201,40 +367,9 @@ class AEOValidator:
             "estimated_effort": "medium"
         }
 
-        scores = []
-
-        # Check schema markup validation
-        schema_validations = all_generated_content.get("schema_validations", {})
-        if schema_validations:
-            schema_scores = [v.get("quality_score", 0) for v in schema_validations.values() if v.get("is_valid", False)]
-            if schema_scores:
-                avg_schema_score = sum(schema_scores) / len(schema_scores)
-                scores.append(avg_schema_score)
-            else:
-                readiness_result["blocking_issues"].append("Invalid schema markup detected")
-
-        # Check meta tags validation
-        meta_validation = all_generated_content.get("meta_validation", {})
-        if meta_validation and not meta_validation.get("is_valid", True):
-            readiness_result["blocking_issues"].append("Meta tags validation failed")
-        else:
-            scores.append(0.8)  # Default good score for valid meta tags
-
-        # Check AI optimization validation
-        ai_validation = all_generated_content.get("ai_optimization_validation", {})
-        if ai_validation:
-            ai_score = (ai_validation.get("quality_score", 0) + ai_validation.get("actionability_score", 0)) / 2
-            scores.append(ai_score)
-
-        # Check content structure validation
-        structure_validation = all_generated_content.get("structure_validation", {})
-        if structure_validation:
-            structure_score = (structure_validation.get("implementation_feasibility", 0) + structure_validation.get("impact_score", 0)) / 2
-            scores.append(structure_score)
-
-        # Calculate overall readiness score
-        if scores:
-            readiness_result["readiness_score"] = sum(scores) / len(scores)
+        blocking_issues, readiness_score = self._assess_readiness(all_generated_content)
+        readiness_result["blocking_issues"] = blocking_issues
+        readiness_result["readiness_score"] = readiness_score
 
         # Determine implementation readiness
         readiness_result["ready_for_implementation"] = (
@@ -251,11 +386,13 @@ class AEOValidator:
             readiness_result["implementation_priority"] = "low"
 
         # Estimate implementation effort
-        total_recommendations = sum([
-            len(all_generated_content.get("schema_packages", {})),
-            len(all_generated_content.get("ai_optimization_content", {}).get("structured_qa_content", {}).get("qa_sections", [])),
-            len(all_generated_content.get("content_structure_improvements", {}).get("heading_structure_fixes", []))
-        ])
+        qa_content = all_generated_content.get("ai_optimization_content", {}).get("structured_qa_content", {})
+        structure_improvements = all_generated_content.get("content_structure_improvements", {})
+        total_recommendations = (
+            len(all_generated_content.get("schema_packages", ())) +
+            len(qa_content.get("qa_sections", ())) +
+            len(structure_improvements.get("heading_structure_fixes", ()))
+        )
 
         if total_recommendations <= 5:
             readiness_result["estimated_effort"] = "low"
@@ -266,31 +403,66 @@ class AEOValidator:
 
         return readiness_result
 
-    def _load_validation_rules(self) -> Dict[str, Any]:
-        """Load validation rules for different content types."""
-        return {
-            "schema_required_properties": {
-                "Organization": ["@context", "@type", "name", "url"],
-                "LocalBusiness": ["@context", "@type", "name", "address", "telephone"],
-                "FAQ": ["@context", "@type", "mainEntity"],
-                "Event": ["@context", "@type", "name", "startDate"],
-                "Product": ["@context", "@type", "name", "description"]
-            },
-            "meta_tag_limits": {
-                "title_min": 30,
-                "title_max": 60,
-                "description_min": 120,
-                "description_max": 160
-            },
-            "quality_thresholds": {
-                "schema_completeness": 0.6,
-                "content_clarity": 0.7,
-                "implementation_feasibility": 0.6
-            }
-        }
+    def is_ready_fast(self, all_generated_content: Dict[str, Any]) -> bool:
+        """Return only the readiness flag, stopping at the first blocking issue."""
+        blocking_issues, readiness_score = self._assess_readiness(all_generated_content, stop_on_blocking=True)
+        return not blocking_issues and readiness_score >= 0.6
+
+    def _assess_readiness(self, all_generated_content: Dict[str, Any], stop_on_blocking: bool = False) -> Tuple[List[str], float]:
+        """Collect blocking issues and the averaged readiness score."""
+        blocking_issues = []
+        total = 0.0
+        count = 0
 
-    def _validate_schema_structure(self, schema_data: Dict[str, Any], schema_type: str) -> Dict[str, Any]:
+        # Check schema markup validation
+        schema_validations = all_generated_content.get("schema_validations", {})
+        if schema_validations:
+            schema_total = 0.0
+            schema_count = 0
+            for validation in schema_validations.values():
+                if validation.get("is_valid", False):
+                    schema_total += validation.get("quality_score", 0)
+                    schema_count += 1
+            if schema_count:
+                total += schema_total / schema_count
+                count += 1
+            else:
+                blocking_issues.append("Invalid schema markup detected")
+                if stop_on_blocking:
+                    return blocking_issues, 0.0
+
+        # Check meta tags validation
+        meta_validation = all_generated_content.get("meta_validation", {})
+        if meta_validation and not meta_validation.get("is_valid", True):
+            blocking_issues.append("Meta tags validation failed")
+            if stop_on_blocking:
+                return blocking_issues, 0.0
+        else:
+            total += 0.8  # Default good score for valid meta tags
+            count += 1
+
+        # Check AI optimization validation
+        ai_validation = all_generated_content.get("ai_optimization_validation", {})
+        if ai_validation:
+            total += (ai_validation.get("quality_score", 0) + ai_validation.get("actionability_score", 0)) / 2
+            count += 1
+
+        # Check content structure validation
+        structure_validation = all_generated_content.get("structure_validation", {})
+        if structure_validation:
+            total += (structure_validation.get("implementation_feasibility", 0) + structure_validation.get("impact_score", 0)) / 2
+            count += 1
+
+        # Calculate overall readiness score
+        readiness_score = total / count if count else 0.0
+
+        return blocking_issues, readiness_score
+
+    def _validate_schema_structure(self, schema_data: Dict[str, Any], schema_type: str) -> Mapping[str, Any]:
         """Validate basic schema structure."""
+        if schema_data.get("@context") == "https://schema.org" and "@type" in schema_data and schema_data["@type"] == schema_type:
+            return self._VALID_STRUCTURE_RESULT
+
         validation = {
             "structure_valid": True,
             "errors": [],
@@ -313,39 +485,60 @@ class AEOValidator:
 
         return validation
 
-    def _validate_schema_content(self, schema_data: Dict[str, Any], schema_type: str) -> Dict[str, Any]:
+    def _validate_schema_content(self, schema_data: Dict[str, Any], schema_type: str) -> SchemaContentValidation:
         """Validate schema content quality and completeness."""
-        validation = {
-            "quality_score": 0.0,
-            "completeness_score": 0.0,
-            "warnings": []
-        }
-
-        required_props = self.validation_rules["schema_required_properties"].get(schema_type, [])
-        present_props = [prop for prop in required_props if prop in schema_data and schema_data[prop]]
+        validation = SchemaContentValidation()
+
+        required_props = self.validation_rules["schema_required_properties"].get(schema_type, ())
+        required_set = frozenset(required_props)
+
+        # Count non-empty properties, required ones and nested typed objects in one pass
+        total_properties = 0
+        required_present = 0
+        nested_objects = 0
+        for key, value in schema_data.items():
+            if not value:
+                continue
+            total_properties += 1
+            if key in required_set:
+                required_present += 1
+            if isinstance(value, dict) and "@type" in value:
+                nested_objects += 1
 
         # Calculate completeness score
         if required_props:
-            validation["completeness_score"] = len(present_props) / len(required_props)
+            validation.completeness_score = required_present / len(required_props)
 
         # Calculate quality score based on content richness
-        total_properties = len([k for k, v in schema_data.items() if v])
         base_quality = min(total_properties / 5, 1.0)  # Up to 5 properties for full score
 
         # Bonus for well-structured nested objects
-        nested_objects = sum(1 for v in schema_data.values() if isinstance(v, dict) and "@type" in v)
         quality_bonus = min(nested_objects * 0.1, 0.3)
 
-        validation["quality_score"] = min(base_quality + quality_bonus, 1.0)
+        validation.quality_score = min(base_quality + quality_bonus, 1.0)
 
         # Add warnings for missing recommended properties
-        if schema_type == "Organization" and "description" not in schema_data:
-            validation["warnings"].append("Consider adding description property")
-        if schema_type == "LocalBusiness" and "openingHours" not in schema_data:
-            validation["warnings"].append("Consider adding openingHours property")
+        validation.warnings = self._validate_schema_specific(schema_data, schema_type)
 
         return validation
 
+    def _validate_schema_specific(self, schema_data: Dict[str, Any], schema_type: str) -> List[str]:
+        """Run type-specific checks for the given schema type."""
+        validator = self._specific_dispatch.get(schema_type)
+        return validator(schema_data) if validator else []
+
+    def _validate_organization_schema(self, schema_data: Dict[str, Any]) -> List[str]:
+        """Check recommended Organization properties."""
+        if "description" not in schema_data:
+            return ["Consider adding description property"]
+        return []
+
+    def _validate_local_business_schema(self, schema_data: Dict[str, Any]) -> List[str]:
+        """Check recommended LocalBusiness properties."""
+        if "openingHours" not in schema_data:
+            return ["Consider adding openingHours property"]
+        return []
+
     def _validate_requirements(self, schema_data: Dict[str, Any], requirements: List[str]) -> Dict[str, Any]:
         """Validate that all requirements are met."""
         validation = {
@@ -353,55 +546,49 @@ class AEOValidator:
             "missing_requirements": []
         }
 
+        present = {key for key, value in schema_data.items() if value}
+
         for requirement in requirements:
-            if "with at least one" in requirement:
-                # Special case for FAQ mainEntity
-                property_name = requirement.split()[0]
-                if property_name not in schema_data or not schema_data[property_name]:
-                    validation["missing_requirements"].append(f"Missing {requirement}")
-                    validation["all_met"] = False
-                elif isinstance(schema_data[property_name], list) and len(schema_data[property_name]) == 0:
-                    validation["missing_requirements"].append(f"Empty {requirement}")
-                    validation["all_met"] = False
-            else:
-                if requirement not in schema_data or not schema_data[requirement]:
-                    validation["missing_requirements"].append(f"Missing required property: {requirement}")
-                    validation["all_met"] = False
+            kind, property_name = _parse_requirement(requirement)
+            if property_name in present:
+                continue
+            # Empty lists are falsy, so they are reported as missing too
+            template = _MISSING_TMPL if kind == "min_one" else _MISSING_PROPERTY_TMPL
+            validation["missing_requirements"].append(template % requirement)
+            validation["all_met"] = False
 
         return validation
 
     async def _llm_validate_schema(self, schema_data: Dict[str, Any], schema_type: str) -> Dict[str, Any]:
         """Use LLM to validate schema for advanced issues."""
-        prompt = f"""
-        Validate this {schema_type} schema markup for quality, correctness, and best practices.
-
-        Schema:
-        {json.dumps(schema_data, indent=2)}
-
-        Check for:
-        1. Schema.org compliance
-        2. Property completeness and accuracy
-        3. Data quality and consistency
-        4. Best practices adherence
-        5. Potential SEO impact
+        cache_key = _schema_cache_key(schema_data, schema_type)
+        cached = self._llm_cache.get(cache_key)
+        if cached is not None:
+            cached_at, cached_result = cached
+            if time.monotonic() - cached_at < self._LLM_CACHE_TTL:
+                self._llm_cache.move_to_end(cache_key)
+                return dict(cached_result)
+            del self._llm_cache[cache_key]
 
-        Return JSON:
-        {{
-            "has_issues": false,
-            "quality_rating": "excellent|good|fair|poor",
-            "suggestions": ["list of specific improvement suggestions"],
-            "seo_impact": "high|medium|low"
-        }}
-        """
+        prompt = _LLM_VALIDATE_PROMPT.format(schema_type=schema_type, schema_json=_dumps_indented(schema_data))
 
         try:
             response = await self.llm_client.generate_text(prompt, max_tokens=800)
-            return json.loads(response)
+            result = _parse_llm_json(response)
+
+            # Only successful reviews are cached; errors are retried next time
+            self._llm_cache[cache_key] = (time.monotonic(), result)
+            if len(self._llm_cache) > self._LLM_CACHE_SIZE:
+                self._llm_cache.popitem(last=False)
+            return dict(result)
         except Exception as e:
             return {"has_issues": False, "quality_rating": "good", "suggestions": [], "error": str(e)}
 
-    def _validate_title_tag(self, title: str) -> Dict[str, Any]:
+    def _validate_title_tag(self, title: str) -> Mapping[str, Any]:
         """Validate title tag."""
+        if title and self._title_min <= len(title) <= self._title_max:
+            return self._VALID_META_RESULT
+
         validation = {
             "is_valid": True,
             "issues": [],
@@ -414,18 +601,21 @@ class AEOValidator:
             return validation
 
         length = len(title)
-        min_length = self.validation_rules["meta_tag_limits"]["title_min"]
-        max_length = self.validation_rules["meta_tag_limits"]["title_max"]
+        min_length = self._title_min
+        max_length = self._title_max
 
         if length < min_length:
             validation["warnings"].append(f"Title too short ({length} chars, recommended: {min_length}-{max_length})")
-        elif length > max_length:
+        else:
             validation["warnings"].append(f"Title too long ({length} chars, recommended: {min_length}-{max_length})")
 
         return validation
 
-    def _validate_meta_description(self, description: str) -> Dict[str, Any]:
+    def _validate_meta_description(self, description: str) -> Mapping[str, Any]:
         """Validate meta description."""
+        if description and self._desc_min <= len(description) <= self._desc_max:
+            return self._VALID_META_RESULT
+
         validation = {
             "is_valid": True,
             "issues": [],
@@ -438,32 +628,33 @@ class AEOValidator:
             return validation
 
         length = len(description)
-        min_length = self.validation_rules["meta_tag_limits"]["description_min"]
-        max_length = self.validation_rules["meta_tag_limits"]["description_max"]
+        min_length = self._desc_min
+        max_length = self._desc_max
 
         if length < min_length:
             validation["warnings"].append(f"Description too short ({length} chars, recommended: {min_length}-{max_length})")
-        elif length > max_length:
+        else:
             validation["warnings"].append(f"Description too long ({length} chars, recommended: {min_length}-{max_length})")
 
         return validation
 
-    def _validate_open_graph_tags(self, og_tags: Dict[str, str]) -> Dict[str, Any]:
+    def _validate_open_graph_tags(self, og_tags: Dict[str, str]) -> Dict[str, Sequence[str]]:
         """Validate Open Graph tags."""
+        # Empty tuples stand in until there is something to report
         validation = {
-            "warnings": [],
-            "recommendations": []
+            "warnings": (),
+            "recommendations": ()
         }
 
-        required_og_tags = ["og:title", "og:description", "og:url", "og:type"]
-        missing_tags = [tag for tag in required_og_tags if tag not in og_tags]
-
-        if missing_tags:
-            validation["warnings"].extend([f"Missing Open Graph tag: {tag}" for tag in missing_tags])
+        # One set comparison covers the common case where every required tag is present
+        if not og_tags.keys() >= self._REQUIRED_OG_TAG_SET:
+            validation["warnings"] = [
+                f"Missing Open Graph tag: {tag}" for tag in self._REQUIRED_OG_TAGS if tag not in og_tags
+            ]
 
         # Check for og:image
         if "og:image" not in og_tags:
-            validation["recommendations"].append("Consider adding og:image for better social media sharing")
+            validation["recommendations"] = ["Consider adding og:image for better social media sharing"]
 
         return validation
 
@@ -509,54 +700,28 @@ class AEOValidator:
             return validation
 
         # Check for specific, actionable recommendations
-        actionable_count = 0
-        for rec in recommendations:
-            if any(word in rec.lower() for word in ["add", "use", "break", "create", "implement"]):
-                actionable_count += 1
+        actionable_count = sum(1 for rec in recommendations if _ACTIONABLE_RE.search(rec))
 
         validation["actionability_score"] = actionable_count / len(recommendations) if recommendations else 0.0
 
         return validation
 
-    def _validate_semantic_improvements(self, improvements: List[str]) -> Dict[str, Any]:
+    def _validate_semantic_improvements(self, improvements: List[str]) -> Mapping[str, float]:
         """Validate semantic improvement suggestions."""
-        validation = {
-            "actionability_score": 0.8  # Default high score for semantic improvements
-        }
+        return self._SEMANTIC_RESULT
 
-        return validation
-
-    def _validate_accessibility_enhancements(self, enhancements: List[str]) -> Dict[str, Any]:
+    def _validate_accessibility_enhancements(self, enhancements: List[str]) -> Mapping[str, float]:
         """Validate accessibility enhancement suggestions."""
-        validation = {
-            "actionability_score": 0.9  # Default high score for accessibility improvements
-        }
+        return self._ACCESSIBILITY_RESULT
 
-        return validation
-
-    def _validate_heading_fixes(self, fixes: List[str]) -> Dict[str, Any]:
+    def _validate_heading_fixes(self, fixes: List[str]) -> Mapping[str, float]:
         """Validate heading structure fixes."""
-        validation = {
-            "feasibility": 0.9,  # Heading fixes are usually easy to implement
-            "impact": 0.8       # High impact on SEO and accessibility
-        }
+        return self._HEADING_RESULT
 
-        return validation
-
-    def _validate_content_organization(self, organization: List[str]) -> Dict[str, Any]:
+    def _validate_content_organization(self, organization: List[str]) -> Mapping[str, float]:
         """Validate content organization recommendations."""
-        validation = {
-            "feasibility": 0.6,  # May require more work
-            "impact": 0.7       # Good impact on user experience
-        }
-
-        return validation
+        return self._ORGANIZATION_RESULT
 
-    def _validate_readability_improvements(self, improvements: List[str]) -> Dict[str, Any]:
+    def _validate_readability_improvements(self, improvements: List[str]) -> Mapping[str, float]:
         """Validate readability improvement suggestions."""
-        validation = {
-            "feasibility": 0.7,  # Moderate effort to implement
-            "impact": 0.6       # Moderate impact on user experience
-        }
-
-        return validation
\ No newline at end of file
+        return self._READABILITY_RESULT
\ No newline at end of file
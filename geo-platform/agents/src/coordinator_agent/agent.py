@@ -4,7 +4,7 @@ Orchestrates multiple agents, resolves conflicts, and prioritizes recommendation
 """
 
 import time
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from collections import defaultdict
 
 from ..shared.base_agent import BaseAgent
@@ -133,42 +133,49 @@ class CoordinatorAgent(BaseAgent):
         # Create a map of conflicted result IDs
         conflicted_ids = set()
         resolution_map = {}
+        agent_result_index = {name: response.results for name, response in self.agent_responses.items()}
+        result_texts: Dict[int, str] = {}
 
         for resolution in conflict_resolutions:
+            keywords = self._conflict_keywords(resolution)
+
             # Track which results were involved in conflicts
             for agent_name in resolution.conflicting_agents:
-                if agent_name in self.agent_responses:
-                    agent_results = self.agent_responses[agent_name].results
-                    for result in agent_results:
-                        if self._is_result_related_to_conflict(result, resolution):
-                            conflicted_ids.add(result.id)
+                for result in agent_result_index.get(agent_name, ()):
+                    text = result_texts.get(id(result))
+                    if text is None:
+                        text = self._result_text(result)
+                        result_texts[id(result)] = text
+                    if self._is_result_related_to_conflict(text, keywords):
+                        conflicted_ids.add(result.id)
 
             # Create new unified result from resolution
             resolution_map[resolution.conflict_id] = self._create_result_from_resolution(resolution)
 
-        # Filter out conflicted results and add resolutions
-        unified_results = []
-
-        # Add non-conflicted results
-        for result in all_results:
-            if result.id not in conflicted_ids:
-                unified_results.append(result)
+        # Keep non-conflicted results, then add resolution results
+        return [
+            *(result for result in all_results if result.id not in conflicted_ids),
+            *resolution_map.values()
+        ]
 
-        # Add resolution results
-        unified_results.extend(resolution_map.values())
+    def _conflict_keywords(self, resolution: ConflictResolution) -> Tuple[str, ...]:
+        """
+        Extract the significant words of a conflict description.
+        """
+        return tuple(dict.fromkeys(word for word in resolution.conflict_description.lower().split() if len(word) > 3))
 
-        return unified_results
+    def _result_text(self, result: AnalysisResult) -> str:
+        """
+        Build the lowercased searchable text of a result.
+        """
+        return f"{result.type} {result.title} {result.description}".lower()
 
-    def _is_result_related_to_conflict(self, result: AnalysisResult, resolution: ConflictResolution) -> bool:
+    def _is_result_related_to_conflict(self, result_text: str, keywords: Tuple[str, ...]) -> bool:
         """
         Check if a result is related to a specific conflict.
         """
-        # Simple heuristic: check if result type or title relates to conflict description
-        conflict_keywords = resolution.conflict_description.lower().split()
-        result_text = f"{result.type} {result.title} {result.description}".lower()
-
-        # If any conflict keywords appear in result text, consider it related
-        return any(keyword in result_text for keyword in conflict_keywords if len(keyword) > 3)
+        # Simple heuristic: any significant conflict keyword appears in the result text
+        return any(keyword in result_text for keyword in keywords)
 
     def _create_result_from_resolution(self, resolution: ConflictResolution) -> AnalysisResult:
         """
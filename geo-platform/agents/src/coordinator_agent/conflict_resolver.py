@@ -4,7 +4,10 @@ Detects and resolves contradictory recommendations between agents.
 """
 
 import asyncio
-from typing import List, Dict, Any, Set, Tuple
+import itertools
+import re
+import string
+from typing import List, Dict, Any, Optional, Set, Tuple
 from collections import defaultdict
 import difflib
 
@@ -14,6 +17,40 @@ from ..shared.models import (
 )
 from ..shared.llm_client import LLMClient
 
+try:
+    import numpy as np
+    from rapidfuzz import fuzz, process
+except ImportError:  # optional speedup; difflib is used otherwise
+    np = fuzz = process = None
+
+
+# Opposing keyword axes used to spot contradictory recommendations
+_CONTRADICTORY_PAIRS = (
+    (("add", "implement", "create"), ("remove", "delete", "disable")),
+    (("increase", "enhance", "improve"), ("decrease", "reduce", "minimize")),
+    (("enable", "activate"), ("disable", "deactivate")),
+    (("show", "display"), ("hide", "conceal")),
+)
+
+# Opposing keyword axes used to spot conflicting implementation steps
+_STEP_CONFLICT_PAIRS = (
+    (("add",), ("remove",)),
+    (("create",), ("delete",)),
+    (("enable",), ("disable",)),
+    (("increase",), ("decrease",)),
+)
+
+# Strips punctuation when canonicalizing implementation steps
+_PUNCT_TRANS = str.maketrans('', '', string.punctuation)
+
+# Lower rank means higher priority
+_PRIORITY_RANK = {
+    PriorityLevel.CRITICAL: 0,
+    PriorityLevel.HIGH: 1,
+    PriorityLevel.MEDIUM: 2,
+    PriorityLevel.LOW: 3
+}
+
 
 class ConflictType:
     """Types of conflicts that can occur between agents."""
@@ -29,9 +66,25 @@ class ConflictResolver:
     Resolves conflicts between agent recommendations.
     """
 
+    # Cap on concurrent LLM requests for the batched contradiction prompts
+    _MAX_CONCURRENT_RESOLUTIONS = 16
+
+    # Title/description similarity ratio above which results count as similar
+    _SIMILARITY_THRESHOLD = 0.6
+
     def __init__(self, llm_client: LLMClient):
         self.llm_client = llm_client
         self.conflict_strategies = self._initialize_strategies()
+        self._resolver_map = {
+            ConflictType.CONTRADICTORY_RECOMMENDATIONS: self._resolve_contradictory_recommendations,
+            ConflictType.OVERLAPPING_SCOPE: self._resolve_overlapping_scope,
+            ConflictType.PRIORITY_MISMATCH: self._resolve_priority_mismatch,
+            ConflictType.IMPLEMENTATION_CONFLICT: self._resolve_implementation_conflict,
+        }
+        self.pos_word_to_axis, self.neg_word_to_axis = self._initialize_keyword_axes(_CONTRADICTORY_PAIRS)
+        self.step_pos_to_axis, self.step_neg_to_axis = self._initialize_keyword_axes(_STEP_CONFLICT_PAIRS)
+        self._recommendation_keyword_re = self._compile_keyword_pattern(self.pos_word_to_axis, self.neg_word_to_axis)
+        self._step_keyword_re = self._compile_keyword_pattern(self.step_pos_to_axis, self.step_neg_to_axis)
 
     async def detect_conflicts(self, agent_responses: List[AgentResponse]) -> List[Dict[str, Any]]:
         """
@@ -45,16 +98,19 @@ class ConflictResolver:
         """
         conflicts = []
 
-        # Check for contradictory recommendations
-        contradictory_conflicts = await self._detect_contradictory_recommendations(agent_responses)
+        # Every conflict type pairs results from two different responses
+        if len(agent_responses) < 2:
+            return conflicts
+
+        # Check for contradictory recommendations and priority mismatches in one sweep
+        contradictory_conflicts, priority_conflicts = await self._detect_pairwise_conflicts(agent_responses)
         conflicts.extend(contradictory_conflicts)
 
         # Check for overlapping scope conflicts
         overlapping_conflicts = await self._detect_overlapping_scope(agent_responses)
         conflicts.extend(overlapping_conflicts)
 
-        # Check for priority mismatches
-        priority_conflicts = await self._detect_priority_mismatches(agent_responses)
+        # Add priority mismatches
         conflicts.extend(priority_conflicts)
 
         # Check for implementation conflicts
@@ -75,65 +131,159 @@ class ConflictResolver:
             List of conflict resolutions
         """
         resolutions = []
+        outcomes: List[Any] = [None] * len(conflicts)
+        llm_positions = []
+        prompts = []
+        other_positions = []
+
+        # Contradictions share one batched LLM request; the rest resolve locally
+        for position, conflict in enumerate(conflicts):
+            if conflict.get("type") != ConflictType.CONTRADICTORY_RECOMMENDATIONS:
+                other_positions.append(position)
+                continue
+            try:
+                prompts.append(self._build_contradiction_prompt(conflict, website_data))
+                llm_positions.append(position)
+            except Exception as e:
+                outcomes[position] = e
+
+        batch_outcome, *other_outcomes = await asyncio.gather(
+            self._generate_unified_recommendations(prompts),
+            *(self._resolve_single_conflict(conflicts[position], website_data) for position in other_positions),
+            return_exceptions=True
+        )
+
+        for position, outcome in zip(other_positions, other_outcomes):
+            outcomes[position] = outcome
 
-        for conflict in conflicts:
+        for slot, position in enumerate(llm_positions):
+            conflict = conflicts[position]
             try:
-                resolution = await self._resolve_single_conflict(conflict, website_data)
-                if resolution:
-                    resolutions.append(resolution)
+                unified_recommendation = None if isinstance(batch_outcome, Exception) else batch_outcome[slot]
+                if unified_recommendation is None:
+                    # Fallback to rule-based resolution for this conflict only
+                    unified_recommendation = self._rule_based_resolution(conflict["results"])
+                outcomes[position] = self._create_contradiction_resolution(conflict, unified_recommendation)
             except Exception as e:
+                outcomes[position] = e
+
+        for conflict, outcome in zip(conflicts, outcomes):
+            if isinstance(outcome, Exception):
                 # Log error but continue with other resolutions
-                print(f"Error resolving conflict {conflict.get('id', 'unknown')}: {e}")
+                print(f"Error resolving conflict {conflict.get('id', 'unknown')}: {outcome}")
                 continue
+            if outcome:
+                resolutions.append(outcome)
 
         return resolutions
 
-    async def _detect_contradictory_recommendations(self, agent_responses: List[AgentResponse]) -> List[Dict[str, Any]]:
+    async def _generate_unified_recommendations(self, prompts: List[str]) -> List[Optional[str]]:
+        """
+        Generate unified recommendations for all contradiction prompts in one batch.
         """
-        Detect contradictory recommendations between agents.
+        if not prompts:
+            return []
+        return await self.llm_client.generate_text_batch(prompts, max_concurrency=self._MAX_CONCURRENT_RESOLUTIONS)
+
+    async def _detect_pairwise_conflicts(self, agent_responses: List[AgentResponse]) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """
+        Detect contradictory recommendations and priority mismatches between agents.
+        """
+        results: List[AnalysisResult] = []
+        owners: List[int] = []
+        agents: List[str] = []
+        pos_index: Dict[int, List[int]] = defaultdict(list)
+        neg_index: Dict[int, List[int]] = defaultdict(list)
+
+        # Flatten and index every result once for both analyses; results pair across responses
+        for response_index, response in enumerate(agent_responses):
+            for result in response.results:
+                position = len(results)
+                results.append(result)
+                owners.append(response_index)
+                agents.append(response.agent_name)
+                pos_axes, neg_axes = self._recommendation_axes(result.recommendation)
+                for axis in pos_axes:
+                    pos_index[axis].append(position)
+                for axis in neg_axes:
+                    neg_index[axis].append(position)
+
+        contradictory_conflicts = self._contradiction_conflicts(results, agents, pos_index, neg_index, owners)
+        priority_conflicts = self._priority_mismatch_conflicts(results, agents, owners)
+
+        return contradictory_conflicts, priority_conflicts
+
+    def _contradiction_conflicts(self, results: List[AnalysisResult], agents: List[str],
+                                 pos_index: Dict[int, List[int]], neg_index: Dict[int, List[int]],
+                                 owners: List[int]) -> List[Dict[str, Any]]:
+        """
+        Build contradictory-recommendation conflicts from the keyword-axis index.
         """
         conflicts = []
-        result_pairs = []
-
-        # Get all result pairs from different agents
-        for i, response1 in enumerate(agent_responses):
-            for j, response2 in enumerate(agent_responses[i+1:], i+1):
-                for result1 in response1.results:
-                    for result2 in response2.results:
-                        result_pairs.append((result1, result2, response1.agent_name, response2.agent_name))
-
-        # Check each pair for contradictions
-        for result1, result2, agent1, agent2 in result_pairs:
-            if await self._are_recommendations_contradictory(result1, result2):
-                conflict_id = f"contradiction_{len(conflicts)}"
-                conflicts.append({
-                    "id": conflict_id,
-                    "type": ConflictType.CONTRADICTORY_RECOMMENDATIONS,
-                    "agents": [agent1, agent2],
-                    "results": [result1, result2],
-                    "description": f"Contradictory recommendations between {agent1} and {agent2}",
-                    "severity": self._calculate_conflict_severity(result1, result2)
-                })
+
+        # Emit in response-pair/result order so conflict ids stay stable
+        for i, j in self._in_response_pair_order(self._opposing_pairs(pos_index, neg_index, owners), owners):
+            result1, result2 = results[i], results[j]
+            agent1, agent2 = agents[i], agents[j]
+            conflict_id = f"contradiction_{len(conflicts)}"
+            conflicts.append({
+                "id": conflict_id,
+                "type": ConflictType.CONTRADICTORY_RECOMMENDATIONS,
+                "agents": [agent1, agent2],
+                "results": [result1, result2],
+                "description": f"Contradictory recommendations between {agent1} and {agent2}",
+                "severity": self._calculate_conflict_severity(result1, result2)
+            })
 
         return conflicts
 
+    def _opposing_pairs(self, pos_index: Dict[int, List[int]], neg_index: Dict[int, List[int]],
+                        owners: List[Any]) -> List[Tuple[int, int]]:
+        """
+        Return sorted (i, j) positions on opposite sides of an axis with different owners.
+        """
+        pairs = set()
+
+        # Only entries on opposite sides of the same axis can conflict
+        for axis, positives in pos_index.items():
+            negatives = neg_index.get(axis)
+            if not negatives:
+                continue
+            for pos, neg in itertools.product(positives, negatives):
+                if owners[pos] != owners[neg]:
+                    pairs.add((pos, neg) if pos < neg else (neg, pos))
+
+        return sorted(pairs)
+
+    def _in_response_pair_order(self, pairs: List[Tuple[int, int]], owners: List[int]) -> List[Tuple[int, int]]:
+        """
+        Order (i, j) result positions by response pair first, then by result within each response.
+        """
+        return sorted(pairs, key=lambda pair: (owners[pair[0]], owners[pair[1]], pair))
+
     async def _detect_overlapping_scope(self, agent_responses: List[AgentResponse]) -> List[Dict[str, Any]]:
         """
         Detect overlapping scope conflicts.
         """
         conflicts = []
-        type_groups = defaultdict(list)
+        type_groups: Dict[str, List[Tuple[AnalysisResult, str]]] = {}
+        type_groups_get = type_groups.get
 
         # Group results by type
         for response in agent_responses:
+            agent_name = response.agent_name
             for result in response.results:
-                type_groups[result.type].append((result, response.agent_name))
+                bucket = type_groups_get(result.type)
+                if bucket is None:
+                    bucket = []
+                    type_groups[result.type] = bucket
+                bucket.append((result, agent_name))
 
         # Check for overlaps within each type
         for result_type, results_and_agents in type_groups.items():
             if len(results_and_agents) > 1:
                 # Multiple agents addressing the same type - potential overlap
-                agents_involved = list(set(agent for _, agent in results_and_agents))
+                agents_involved = list(dict.fromkeys(agent for _, agent in results_and_agents))
                 if len(agents_involved) > 1:
                     conflict_id = f"overlap_{result_type}_{len(conflicts)}"
                     conflicts.append({
@@ -147,24 +297,18 @@ class ConflictResolver:
 
         return conflicts
 
-    async def _detect_priority_mismatches(self, agent_responses: List[AgentResponse]) -> List[Dict[str, Any]]:
+    def _priority_mismatch_conflicts(self, results: List[AnalysisResult], agents: List[str],
+                                     owners: List[int]) -> List[Dict[str, Any]]:
         """
-        Detect priority mismatches for similar recommendations.
+        Build priority-mismatch conflicts for similar results from different agents.
         """
         conflicts = []
-        similar_pairs = []
+        ranks = [_PRIORITY_RANK[result.priority] for result in results]
 
         # Find similar results with different priorities
-        for i, response1 in enumerate(agent_responses):
-            for j, response2 in enumerate(agent_responses[i+1:], i+1):
-                for result1 in response1.results:
-                    for result2 in response2.results:
-                        if (self._are_results_similar(result1, result2) and
-                            result1.priority != result2.priority):
-                            similar_pairs.append((result1, result2, response1.agent_name, response2.agent_name))
-
-        # Create conflicts for priority mismatches
-        for result1, result2, agent1, agent2 in similar_pairs:
+        for i, j in self._in_response_pair_order(self._find_similar_pairs(results, owners, ranks), owners):
+            result1, result2 = results[i], results[j]
+            agent1, agent2 = agents[i], agents[j]
             conflict_id = f"priority_mismatch_{len(conflicts)}"
             conflicts.append({
                 "id": conflict_id,
@@ -177,32 +321,118 @@ class ConflictResolver:
 
         return conflicts
 
+    def _find_similar_pairs(self, results: List[AnalysisResult], owners: List[int],
+                            ranks: List[int]) -> List[Tuple[int, int]]:
+        """
+        Return ordered (i, j) pairs of similar results with different owners and priorities.
+        """
+        if process is None:
+            return self._find_similar_pairs_difflib(results, owners, ranks)
+
+        # Indel similarity (fuzz.ratio) is 2*LCS/(len1+len2), an upper bound on
+        # SequenceMatcher.ratio(), so a batched rapidfuzz pass can only over-select
+        titles = [result.title for result in results]
+        descriptions = [result.description for result in results]
+        cutoff = self._SIMILARITY_THRESHOLD * 100
+        title_scores = process.cdist(titles, titles, scorer=fuzz.ratio, score_cutoff=cutoff, workers=-1)
+        desc_scores = process.cdist(descriptions, descriptions, scorer=fuzz.ratio, score_cutoff=cutoff, workers=-1)
+
+        owner_arr = np.asarray(owners, dtype=np.intp)
+        rank_arr = np.asarray(ranks, dtype=np.intp)
+        mask = (title_scores >= cutoff) | (desc_scores >= cutoff)
+        mask &= owner_arr[:, None] != owner_arr[None, :]
+        mask &= rank_arr[:, None] != rank_arr[None, :]
+
+        # Confirm the surviving candidates with the difflib ratio the detector is defined by
+        pairs = []
+        matcher = difflib.SequenceMatcher(None)
+        for i, j in np.argwhere(np.triu(mask, k=1)).tolist():
+            result1, result2 = results[i], results[j]
+            matcher.set_seqs(result1.title, result2.title)
+            if self._exceeds_similarity(matcher):
+                pairs.append((i, j))
+                continue
+            matcher.set_seqs(result1.description, result2.description)
+            if self._exceeds_similarity(matcher):
+                pairs.append((i, j))
+
+        return pairs
+
+    def _find_similar_pairs_difflib(self, results: List[AnalysisResult], owners: List[int],
+                                    ranks: List[int]) -> List[Tuple[int, int]]:
+        """
+        Pure-Python fallback for _find_similar_pairs.
+        """
+        pairs = []
+        title_matcher = difflib.SequenceMatcher(None)
+        desc_matcher = difflib.SequenceMatcher(None)
+
+        # SequenceMatcher caches its analysis of seq2, so fix each later result there once
+        for j, result2 in enumerate(results):
+            title_matcher.set_seq2(result2.title)
+            desc_matcher.set_seq2(result2.description)
+            for i in range(j):
+                # Equal priorities never mismatch, so skip the similarity work
+                if owners[i] == owners[j] or ranks[i] == ranks[j]:
+                    continue
+                result1 = results[i]
+                title_matcher.set_seq1(result1.title)
+                if self._exceeds_similarity(title_matcher):
+                    pairs.append((i, j))
+                    continue
+                desc_matcher.set_seq1(result1.description)
+                if self._exceeds_similarity(desc_matcher):
+                    pairs.append((i, j))
+
+        return pairs
+
+    def _exceeds_similarity(self, matcher: difflib.SequenceMatcher) -> bool:
+        """
+        Check a matcher's ratio against the threshold, cheapest upper bounds first.
+        """
+        threshold = self._SIMILARITY_THRESHOLD
+        return (matcher.real_quick_ratio() > threshold and
+                matcher.quick_ratio() > threshold and
+                matcher.ratio() > threshold)
+
     async def _detect_implementation_conflicts(self, agent_responses: List[AgentResponse]) -> List[Dict[str, Any]]:
         """
         Detect implementation conflicts between recommendations.
         """
         conflicts = []
-        implementation_steps = []
+        steps: List[Tuple[str, AnalysisResult]] = []
+        agents: List[str] = []
+        pos_buckets: Dict[int, List[int]] = defaultdict(list)
+        neg_buckets: Dict[int, List[int]] = defaultdict(list)
 
-        # Collect all implementation steps
+        # Bucket every implementation step by the conflict axes it mentions
         for response in agent_responses:
             for result in response.results:
                 for step in result.implementation_steps:
-                    implementation_steps.append((step, result, response.agent_name))
-
-        # Check for conflicting implementation steps
-        for i, (step1, result1, agent1) in enumerate(implementation_steps):
-            for j, (step2, result2, agent2) in enumerate(implementation_steps[i+1:], i+1):
-                if agent1 != agent2 and self._are_steps_conflicting(step1, step2):
-                    conflict_id = f"implementation_conflict_{len(conflicts)}"
-                    conflicts.append({
-                        "id": conflict_id,
-                        "type": ConflictType.IMPLEMENTATION_CONFLICT,
-                        "agents": [agent1, agent2],
-                        "results": [result1, result2],
-                        "description": f"Conflicting implementation steps: '{step1}' vs '{step2}'",
-                        "severity": "high"
-                    })
+                    position = len(steps)
+                    steps.append((step, result))
+                    agents.append(response.agent_name)
+                    pos_axes, neg_axes = self._keyword_axes(
+                        step, self._step_keyword_re, self.step_pos_to_axis, self.step_neg_to_axis
+                    )
+                    for axis in pos_axes:
+                        pos_buckets[axis].append(position)
+                    for axis in neg_axes:
+                        neg_buckets[axis].append(position)
+
+        # Emit in step order so conflict ids stay stable
+        for i, j in self._opposing_pairs(pos_buckets, neg_buckets, agents):
+            (step1, result1), (step2, result2) = steps[i], steps[j]
+            agent1, agent2 = agents[i], agents[j]
+            conflict_id = f"implementation_conflict_{len(conflicts)}"
+            conflicts.append({
+                "id": conflict_id,
+                "type": ConflictType.IMPLEMENTATION_CONFLICT,
+                "agents": [agent1, agent2],
+                "results": [result1, result2],
+                "description": f"Conflicting implementation steps: '{step1}' vs '{step2}'",
+                "severity": "high"
+            })
 
         return conflicts
 
@@ -210,29 +440,31 @@ class ConflictResolver:
         """
         Resolve a single conflict.
         """
-        conflict_type = conflict["type"]
-        strategy = self.conflict_strategies.get(conflict_type, "merge")
-
-        if conflict_type == ConflictType.CONTRADICTORY_RECOMMENDATIONS:
-            return await self._resolve_contradictory_recommendations(conflict, website_data)
-        elif conflict_type == ConflictType.OVERLAPPING_SCOPE:
-            return await self._resolve_overlapping_scope(conflict, website_data)
-        elif conflict_type == ConflictType.PRIORITY_MISMATCH:
-            return await self._resolve_priority_mismatch(conflict, website_data)
-        elif conflict_type == ConflictType.IMPLEMENTATION_CONFLICT:
-            return await self._resolve_implementation_conflict(conflict, website_data)
-        else:
-            return await self._resolve_generic_conflict(conflict, website_data)
+        handler = self._resolver_map.get(conflict["type"], self._resolve_generic_conflict)
+        return await handler(conflict, website_data)
 
     async def _resolve_contradictory_recommendations(self, conflict: Dict[str, Any], website_data: WebsiteData) -> ConflictResolution:
         """
         Resolve contradictory recommendations.
         """
+        prompt = self._build_contradiction_prompt(conflict, website_data)
+
+        try:
+            unified_recommendation = await self.llm_client.generate_text(prompt)
+        except Exception:
+            # Fallback to rule-based resolution
+            unified_recommendation = self._rule_based_resolution(conflict["results"])
+
+        return self._create_contradiction_resolution(conflict, unified_recommendation)
+
+    def _build_contradiction_prompt(self, conflict: Dict[str, Any], website_data: WebsiteData) -> str:
+        """
+        Build the LLM prompt used to unify contradictory recommendations.
+        """
         results = conflict["results"]
         agents = conflict["agents"]
 
-        # Use LLM to determine the best approach
-        prompt = f"""
+        return f"""
         Two agents have provided contradictory recommendations:
 
         Agent {agents[0]}: {results[0].recommendation}
@@ -249,15 +481,13 @@ class ConflictResolver:
         Return only the final recommendation without explanation.
         """
 
-        try:
-            unified_recommendation = await self.llm_client.generate_text(prompt)
-        except Exception:
-            # Fallback to rule-based resolution
-            unified_recommendation = self._rule_based_resolution(results)
-
+    def _create_contradiction_resolution(self, conflict: Dict[str, Any], unified_recommendation: str) -> ConflictResolution:
+        """
+        Create the resolution for a contradictory-recommendation conflict.
+        """
         return ConflictResolution(
             conflict_id=conflict["id"],
-            conflicting_agents=agents,
+            conflicting_agents=conflict["agents"],
             conflict_description=conflict["description"],
             resolution_strategy="LLM-guided unification",
             final_recommendation=unified_recommendation,
@@ -273,13 +503,15 @@ class ConflictResolver:
 
         # Merge overlapping recommendations
         merged_steps = []
-        seen_steps = set()
+        seen_keys: Set[frozenset] = set()
 
+        # Treat steps differing only in case, punctuation or spacing as duplicates
         for result in results:
             for step in result.implementation_steps:
-                if step.lower() not in seen_steps:
+                key = frozenset(step.lower().translate(_PUNCT_TRANS).split())
+                if key and key not in seen_keys:
                     merged_steps.append(step)
-                    seen_steps.add(step.lower())
+                    seen_keys.add(key)
 
         final_recommendation = f"Consolidated approach addressing {conflict['description']}: {', '.join(merged_steps[:3])}..."
 
@@ -300,8 +532,7 @@ class ConflictResolver:
         agents = conflict["agents"]
 
         # Choose the higher priority as the resolved priority
-        priority_order = [PriorityLevel.CRITICAL, PriorityLevel.HIGH, PriorityLevel.MEDIUM, PriorityLevel.LOW]
-        highest_priority = min(results, key=lambda r: priority_order.index(r.priority)).priority
+        highest_priority = min(results, key=lambda r: _PRIORITY_RANK[r.priority]).priority
 
         final_recommendation = f"Resolved priority conflict: Set priority to {highest_priority} based on agent consensus"
 
@@ -361,61 +592,55 @@ class ConflictResolver:
             ConflictType.RESOURCE_COMPETITION: "optimize"
         }
 
-    async def _are_recommendations_contradictory(self, result1: AnalysisResult, result2: AnalysisResult) -> bool:
+    def _initialize_keyword_axes(self, keyword_pairs) -> Tuple[Dict[str, Tuple[int, ...]], Dict[str, Tuple[int, ...]]]:
         """
-        Check if two recommendations are contradictory.
+        Flatten the contradictory keyword pairs into word -> axis lookups.
         """
-        # Simple heuristic: check for opposite keywords
-        contradictory_pairs = [
-            (["add", "implement", "create"], ["remove", "delete", "disable"]),
-            (["increase", "enhance", "improve"], ["decrease", "reduce", "minimize"]),
-            (["enable", "activate"], ["disable", "deactivate"]),
-            (["show", "display"], ["hide", "conceal"])
-        ]
-
-        rec1 = result1.recommendation.lower()
-        rec2 = result2.recommendation.lower()
+        pos_word_to_axis: Dict[str, Tuple[int, ...]] = {}
+        neg_word_to_axis: Dict[str, Tuple[int, ...]] = {}
 
-        for positive_words, negative_words in contradictory_pairs:
-            if (any(word in rec1 for word in positive_words) and
-                any(word in rec2 for word in negative_words)) or \
-               (any(word in rec2 for word in positive_words) and
-                any(word in rec1 for word in negative_words)):
-                return True
+        # A word may sit on several axes (e.g. "disable")
+        for axis, (positive_words, negative_words) in enumerate(keyword_pairs):
+            for word in positive_words:
+                pos_word_to_axis[word] = pos_word_to_axis.get(word, ()) + (axis,)
+            for word in negative_words:
+                neg_word_to_axis[word] = neg_word_to_axis.get(word, ()) + (axis,)
 
-        return False
+        return pos_word_to_axis, neg_word_to_axis
 
-    def _are_results_similar(self, result1: AnalysisResult, result2: AnalysisResult) -> bool:
+    def _compile_keyword_pattern(self, pos_word_to_axis: Dict[str, Tuple[int, ...]],
+                                 neg_word_to_axis: Dict[str, Tuple[int, ...]]) -> "re.Pattern[str]":
         """
-        Check if two results are similar enough to have priority conflicts.
+        Compile one alternation that finds every keyword of an axis family as a substring.
         """
-        # Use string similarity for titles and descriptions
-        title_similarity = difflib.SequenceMatcher(None, result1.title, result2.title).ratio()
-        desc_similarity = difflib.SequenceMatcher(None, result1.description, result2.description).ratio()
-
-        return title_similarity > 0.6 or desc_similarity > 0.6
+        # Keywords match inside longer words ("adding", "deactivate" -> "activate"), so
+        # scan with a zero-width lookahead to report overlapping occurrences too
+        words = sorted(set(pos_word_to_axis) | set(neg_word_to_axis), key=len, reverse=True)
+        return re.compile(r"(?=(" + "|".join(map(re.escape, words)) + r"))", re.IGNORECASE)
 
-    def _are_steps_conflicting(self, step1: str, step2: str) -> bool:
+    def _recommendation_axes(self, recommendation: str) -> Tuple[Set[int], Set[int]]:
         """
-        Check if two implementation steps are conflicting.
+        Return the positive and negative keyword axes a recommendation mentions.
         """
-        # Simple conflict detection
-        conflict_indicators = [
-            ("add", "remove"),
-            ("create", "delete"),
-            ("enable", "disable"),
-            ("increase", "decrease")
-        ]
+        return self._keyword_axes(
+            recommendation, self._recommendation_keyword_re, self.pos_word_to_axis, self.neg_word_to_axis
+        )
 
-        step1_lower = step1.lower()
-        step2_lower = step2.lower()
+    def _keyword_axes(self, text: str, keyword_re: "re.Pattern[str]", pos_word_to_axis: Dict[str, Tuple[int, ...]],
+                      neg_word_to_axis: Dict[str, Tuple[int, ...]]) -> Tuple[Set[int], Set[int]]:
+        """
+        Return the positive and negative keyword axes mentioned in text.
+        """
+        # Single C-level scan that only yields keyword hits
+        keywords = {match.lower() for match in keyword_re.findall(text)}
+        pos_axes = set()
+        neg_axes = set()
 
-        for word1, word2 in conflict_indicators:
-            if (word1 in step1_lower and word2 in step2_lower) or \
-               (word2 in step1_lower and word1 in step2_lower):
-                return True
+        for keyword in keywords:
+            pos_axes.update(pos_word_to_axis.get(keyword, ()))
+            neg_axes.update(neg_word_to_axis.get(keyword, ()))
 
-        return False
+        return pos_axes, neg_axes
 
     def _calculate_conflict_severity(self, result1: AnalysisResult, result2: AnalysisResult) -> str:
         """
@@ -437,14 +662,7 @@ class ConflictResolver:
         """
         Calculate severity of priority mismatch.
         """
-        priority_values = {
-            PriorityLevel.LOW: 1,
-            PriorityLevel.MEDIUM: 2,
-            PriorityLevel.HIGH: 3,
-            PriorityLevel.CRITICAL: 4
-        }
-
-        diff = abs(priority_values[priority1] - priority_values[priority2])
+        diff = abs(_PRIORITY_RANK[priority1] - _PRIORITY_RANK[priority2])
         if diff >= 3:
             return "high"
         elif diff >= 2:
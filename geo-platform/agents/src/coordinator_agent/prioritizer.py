@@ -4,7 +4,11 @@ Creates priority matrices and implementation plans for coordinated recommendatio
 """
 
 import asyncio
-from typing import List, Dict, Any, Optional
+import bisect
+import itertools
+import re
+from types import MappingProxyType
+from typing import List, Dict, Any, Iterable, Optional, Tuple
 from datetime import datetime, timedelta
 from collections import defaultdict
 
@@ -15,15 +19,102 @@ from ..shared.models import (
 from ..shared.llm_client import LLMClient
 
 
+# Impact/effort levels that count as high impact and low effort
+_HIGH_IMPACT = frozenset({ImpactLevel.HIGH, ImpactLevel.CRITICAL})
+_LOW_EFFORT = frozenset({EffortLevel.LOW, EffortLevel.MEDIUM})
+
+# Matrix category for each (is_high_impact, is_low_effort) combination
+_CATEGORY_BY_FLAGS = {
+    (True, True): "high_impact_low_effort",
+    (True, False): "high_impact_high_effort",
+    (False, True): "low_impact_low_effort",
+    (False, False): "low_impact_high_effort"
+}
+
+# Sort rank for each priority level; higher sorts first
+_PRIORITY_ORDER = {
+    PriorityLevel.CRITICAL: 4,
+    PriorityLevel.HIGH: 3,
+    PriorityLevel.MEDIUM: 2,
+    PriorityLevel.LOW: 1
+}
+
+# Effort score per level and the labels for average-score bands
+_EFFORT_SCORES = {
+    EffortLevel.LOW: 1,
+    EffortLevel.MEDIUM: 2,
+    EffortLevel.HIGH: 3,
+    EffortLevel.VERY_HIGH: 4
+}
+_EFFORT_THRESHOLDS = (1.5, 2.5, 3.5)  # upper bounds, inclusive
+_EFFORT_LABELS = ("Low", "Medium", "High", "Very High")
+
+# Resource needed when a result type mentions any of the keywords
+_RESOURCE_KEYWORDS = (
+    (("technical", "schema"), "Technical Developer"),
+    (("content", "copywriting"), "Content Creator"),
+    (("design", "ui"), "UI/UX Designer"),
+    (("seo", "optimization"), "SEO Specialist"),
+    (("business", "strategy"), "Business Analyst")
+)
+
+# Success metrics implied when a result type mentions any of the keywords
+_METRIC_KEYWORDS = (
+    (("seo", "schema"), ("Search engine ranking improvements", "Rich snippet appearance in search results")),
+    (("performance", "speed"), ("Page load speed improvements", "Core Web Vitals scores")),
+    (("content", "user"), ("User engagement metrics (time on page, bounce rate)", "Conversion rate improvements")),
+    (("business", "accuracy"), ("Business information accuracy score", "Local search visibility")),
+    (("accessibility",), ("Accessibility compliance score", "User experience improvements"))
+)
+
+# Titles that mark groundwork other recommendations depend on
+_FOUNDATION_TITLE_KEYWORDS = ("foundation", "basic")
+
+# Fallbacks when no keyword matched
+_DEFAULT_RESOURCES = ("Web Developer", "Project Manager")
+_DEFAULT_DEPENDENCIES = ("No major dependencies identified",)
+_DEFAULT_METRICS = ("Overall website quality score", "Implementation completion rate")
+
+_KEYWORD_TO_RESOURCE = {keyword: resource for keywords, resource in _RESOURCE_KEYWORDS for keyword in keywords}
+_KEYWORD_TO_METRICS = {keyword: metrics for keywords, metrics in _METRIC_KEYWORDS for keyword in keywords}
+
+
+def _keyword_pattern(keywords) -> "re.Pattern[str]":
+    """Compile a scanner reporting every (possibly overlapping) keyword substring."""
+    return re.compile("(?=(" + "|".join(map(re.escape, keywords)) + "))")
+
+
+_RESOURCE_RE = _keyword_pattern(_KEYWORD_TO_RESOURCE)
+_METRIC_RE = _keyword_pattern(_KEYWORD_TO_METRICS)
+
+# Once every possible resource or metric is collected, further scans are wasted
+_RESOURCE_COUNT = len(set(_KEYWORD_TO_RESOURCE.values()))
+_METRIC_COUNT = len({metric for metrics in _KEYWORD_TO_METRICS.values() for metric in metrics})
+
+
 class Prioritizer:
     """
     Creates priority matrices and implementation plans for recommendations.
     """
 
+    # Level weights are fixed, so every instance shares one read-only mapping
+    IMPACT_WEIGHTS = MappingProxyType({
+        ImpactLevel.LOW: 0.25,
+        ImpactLevel.MEDIUM: 0.5,
+        ImpactLevel.HIGH: 0.75,
+        ImpactLevel.CRITICAL: 1.0
+    })
+    EFFORT_WEIGHTS = MappingProxyType({
+        EffortLevel.LOW: 0.25,
+        EffortLevel.MEDIUM: 0.5,
+        EffortLevel.HIGH: 0.75,
+        EffortLevel.VERY_HIGH: 1.0
+    })
+
     def __init__(self, llm_client: LLMClient):
         self.llm_client = llm_client
-        self.impact_weights = self._initialize_impact_weights()
-        self.effort_weights = self._initialize_effort_weights()
+        self.impact_weights = self.IMPACT_WEIGHTS
+        self.effort_weights = self.EFFORT_WEIGHTS
 
     async def create_priority_matrix(self, results: List[AnalysisResult]) -> PriorityMatrix:
         """
@@ -36,24 +127,16 @@ class Prioritizer:
             PriorityMatrix with categorized recommendations
         """
         matrix = PriorityMatrix()
+        buckets: Dict[tuple, List[AnalysisResult]] = {flags: [] for flags in _CATEGORY_BY_FLAGS}
 
         for result in results:
-            category = self._categorize_by_impact_effort(result)
-
-            if category == "high_impact_low_effort":
-                matrix.high_impact_low_effort.append(result)
-            elif category == "high_impact_high_effort":
-                matrix.high_impact_high_effort.append(result)
-            elif category == "low_impact_low_effort":
-                matrix.low_impact_low_effort.append(result)
-            elif category == "low_impact_high_effort":
-                matrix.low_impact_high_effort.append(result)
+            buckets[(result.impact in _HIGH_IMPACT, result.effort in _LOW_EFFORT)].append(result)
 
         # Sort each category by priority and confidence
-        matrix.high_impact_low_effort = self._sort_results(matrix.high_impact_low_effort)
-        matrix.high_impact_high_effort = self._sort_results(matrix.high_impact_high_effort)
-        matrix.low_impact_low_effort = self._sort_results(matrix.low_impact_low_effort)
-        matrix.low_impact_high_effort = self._sort_results(matrix.low_impact_high_effort)
+        matrix.high_impact_low_effort = self._sort_results(buckets[(True, True)])
+        matrix.high_impact_high_effort = self._sort_results(buckets[(True, False)])
+        matrix.low_impact_low_effort = self._sort_results(buckets[(False, True)])
+        matrix.low_impact_high_effort = self._sort_results(buckets[(False, False)])
 
         return matrix
 
@@ -78,10 +161,11 @@ class Prioritizer:
                 priority_matrix.high_impact_low_effort,
                 current_date,
                 "1-2 weeks",
+                2,
                 "Immediate impact with minimal effort"
             )
             phases.append(phase1)
-            current_date += timedelta(weeks=2)
+            current_date += timedelta(weeks=phase1["duration_weeks"])
 
         # Phase 2: Critical Improvements (High Impact, High Effort)
         if priority_matrix.high_impact_high_effort:
@@ -90,10 +174,11 @@ class Prioritizer:
                 priority_matrix.high_impact_high_effort,
                 current_date,
                 "4-8 weeks",
+                6,
                 "Major improvements requiring significant effort"
             )
             phases.append(phase2)
-            current_date += timedelta(weeks=6)
+            current_date += timedelta(weeks=phase2["duration_weeks"])
 
         # Phase 3: Easy Maintenance (Low Impact, Low Effort)
         if priority_matrix.low_impact_low_effort:
@@ -102,35 +187,35 @@ class Prioritizer:
                 priority_matrix.low_impact_low_effort,
                 current_date,
                 "2-4 weeks",
+                3,
                 "Low-effort maintenance and optimization"
             )
             phases.append(phase3)
-            current_date += timedelta(weeks=3)
+            current_date += timedelta(weeks=phase3["duration_weeks"])
 
         # Phase 4: Future Considerations (Low Impact, High Effort) - only if resources allow
         if priority_matrix.low_impact_high_effort:
             phase4 = self._create_phase(
                 "Future Considerations",
-                priority_matrix.low_impact_high_effort[:3],  # Limit to top 3
+                itertools.islice(priority_matrix.low_impact_high_effort, 3),  # Limit to top 3
                 current_date,
                 "8+ weeks",
+                10,
                 "Future improvements when resources are available"
             )
             phases.append(phase4)
 
         # Calculate overall timeline and resources
-        total_weeks = sum(self._estimate_phase_duration(phase) for phase in phases)
+        total_weeks = sum(phase["duration_weeks"] for phase in phases)
         estimated_timeline = f"{total_weeks} weeks total"
 
-        # Gather resource requirements
-        all_results = (priority_matrix.high_impact_low_effort +
-                      priority_matrix.high_impact_high_effort +
-                      priority_matrix.low_impact_low_effort +
-                      priority_matrix.low_impact_high_effort)
+        # Gather resource requirements, dependencies and success metrics
+        all_results = itertools.chain(priority_matrix.high_impact_low_effort,
+                                      priority_matrix.high_impact_high_effort,
+                                      priority_matrix.low_impact_low_effort,
+                                      priority_matrix.low_impact_high_effort)
 
-        resource_requirements = self._calculate_resource_requirements(all_results)
-        dependencies = self._identify_dependencies(all_results)
-        success_metrics = self._define_success_metrics(all_results, website_data)
+        resource_requirements, dependencies, success_metrics = self._analyze_results(all_results, website_data)
 
         return ImplementationPlan(
             phases=phases,
@@ -144,194 +229,108 @@ class Prioritizer:
         """
         Categorize a result by its impact and effort levels.
         """
-        is_high_impact = result.impact in [ImpactLevel.HIGH, ImpactLevel.CRITICAL]
-        is_low_effort = result.effort in [EffortLevel.LOW, EffortLevel.MEDIUM]
-
-        if is_high_impact and is_low_effort:
-            return "high_impact_low_effort"
-        elif is_high_impact and not is_low_effort:
-            return "high_impact_high_effort"
-        elif not is_high_impact and is_low_effort:
-            return "low_impact_low_effort"
-        else:
-            return "low_impact_high_effort"
+        return _CATEGORY_BY_FLAGS[(result.impact in _HIGH_IMPACT, result.effort in _LOW_EFFORT)]
 
     def _sort_results(self, results: List[AnalysisResult]) -> List[AnalysisResult]:
         """
         Sort results by priority, then by confidence.
         """
-        priority_order = {
-            PriorityLevel.CRITICAL: 4,
-            PriorityLevel.HIGH: 3,
-            PriorityLevel.MEDIUM: 2,
-            PriorityLevel.LOW: 1
-        }
-
-        return sorted(results, key=lambda r: (
-            priority_order.get(r.priority, 0),
-            r.confidence
-        ), reverse=True)
+        priority_get = _PRIORITY_ORDER.get
+        return sorted(results, key=lambda r: (priority_get(r.priority, 0), r.confidence), reverse=True)
 
-    def _create_phase(self, name: str, results: List[AnalysisResult], start_date: datetime,
-                     duration: str, description: str) -> Dict[str, Any]:
+    def _create_phase(self, name: str, results: Iterable[AnalysisResult], start_date: datetime,
+                     duration: str, duration_weeks: int, description: str) -> Dict[str, Any]:
         """
         Create a phase dictionary for the implementation plan.
         """
-        return {
-            "name": name,
-            "description": description,
-            "duration": duration,
-            "start_date": start_date.strftime("%Y-%m-%d"),
-            "recommendations": [{
+        recommendations = []
+        expected_outcomes = []
+        total_effort = 0
+
+        # Collect recommendations, outcomes and effort in a single pass
+        index = -1
+        for index, result in enumerate(results):
+            total_effort += _EFFORT_SCORES.get(result.effort, 2)
+            recommendations.append({
                 "id": result.id,
                 "title": result.title,
                 "priority": result.priority,
                 "effort": result.effort,
-                "implementation_steps": result.implementation_steps[:3]  # Limit to top 3 steps
-            } for result in results],
-            "effort_estimate": self._calculate_phase_effort(results),
-            "expected_outcomes": [result.recommendation for result in results[:3]]  # Top 3 outcomes
-        }
+                # Top 3 steps; slicing copies, so the plan never aliases the result's list
+                "implementation_steps": result.implementation_steps[:3]
+            })
+            if index < 3:  # Top 3 outcomes
+                expected_outcomes.append(result.recommendation)
 
-    def _estimate_phase_duration(self, phase: Dict[str, Any]) -> int:
-        """
-        Estimate phase duration in weeks.
-        """
-        duration_map = {
-            "1-2 weeks": 2,
-            "4-8 weeks": 6,
-            "2-4 weeks": 3,
-            "8+ weeks": 10
+        return {
+            "name": name,
+            "description": description,
+            "duration": duration,
+            "duration_weeks": duration_weeks,
+            "start_date": start_date.date().isoformat(),
+            "recommendations": recommendations,
+            "effort_estimate": self._effort_label(total_effort, index + 1),
+            "expected_outcomes": expected_outcomes
         }
-        return duration_map.get(phase["duration"], 4)
 
-    def _calculate_phase_effort(self, results: List[AnalysisResult]) -> str:
+    def _effort_label(self, total_effort: int, count: int) -> str:
         """
-        Calculate total effort for a phase.
+        Label the average effort score of a phase.
         """
-        effort_scores = {
-            EffortLevel.LOW: 1,
-            EffortLevel.MEDIUM: 2,
-            EffortLevel.HIGH: 3,
-            EffortLevel.VERY_HIGH: 4
-        }
+        avg_effort = total_effort / count if count else 0
+        return _EFFORT_LABELS[bisect.bisect_left(_EFFORT_THRESHOLDS, avg_effort)]
 
-        total_effort = sum(effort_scores.get(result.effort, 2) for result in results)
-        avg_effort = total_effort / len(results) if results else 0
-
-        if avg_effort <= 1.5:
-            return "Low"
-        elif avg_effort <= 2.5:
-            return "Medium"
-        elif avg_effort <= 3.5:
-            return "High"
-        else:
-            return "Very High"
-
-    def _calculate_resource_requirements(self, results: List[AnalysisResult]) -> List[str]:
+    def _analyze_results(self, results: Iterable[AnalysisResult],
+                         website_data: WebsiteData) -> Tuple[List[str], List[str], List[str]]:
         """
-        Calculate resource requirements based on analysis results.
+        Derive resource requirements, dependencies and success metrics in one pass.
         """
         resources = set()
+        metrics = set()
+        has_schema = has_technical = has_content = False
+        foundation_titles = []
 
         for result in results:
-            # Analyze result types to determine resources needed
-            if "technical" in result.type.lower() or "schema" in result.type.lower():
-                resources.add("Technical Developer")
-            if "content" in result.type.lower() or "copywriting" in result.type.lower():
-                resources.add("Content Creator")
-            if "design" in result.type.lower() or "ui" in result.type.lower():
-                resources.add("UI/UX Designer")
-            if "seo" in result.type.lower() or "optimization" in result.type.lower():
-                resources.add("SEO Specialist")
-            if "business" in result.type.lower() or "strategy" in result.type.lower():
-                resources.add("Business Analyst")
-
-        # Add default resources if none identified
-        if not resources:
-            resources.add("Web Developer")
-            resources.add("Project Manager")
+            t = result.type.lower()
+
+            # Analyze result types to determine resources and metrics
+            if len(resources) < _RESOURCE_COUNT:
+                for keyword in _RESOURCE_RE.findall(t):
+                    resources.add(_KEYWORD_TO_RESOURCE[keyword])
+            if len(metrics) < _METRIC_COUNT:
+                for keyword in _METRIC_RE.findall(t):
+                    metrics.update(_KEYWORD_TO_METRICS[keyword])
+
+            # Look for common dependency patterns until all are found
+            if not (has_schema and has_technical and has_content):
+                has_schema = has_schema or "schema" in t
+                has_technical = has_technical or "technical" in t
+                has_content = has_content or "content" in t
+
+            # Look for sequential implementation needs
+            title_lower = result.title.lower()
+            if any(keyword in title_lower for keyword in _FOUNDATION_TITLE_KEYWORDS):
+                foundation_titles.append(result.title)
 
-        return sorted(list(resources))
-
-    def _identify_dependencies(self, results: List[AnalysisResult]) -> List[str]:
-        """
-        Identify dependencies between recommendations.
-        """
         dependencies = []
 
-        # Look for common dependency patterns
-        has_schema = any("schema" in result.type.lower() for result in results)
-        has_technical = any("technical" in result.type.lower() for result in results)
-        has_content = any("content" in result.type.lower() for result in results)
-
         if has_schema and has_content:
             dependencies.append("Content creation must precede schema implementation")
 
         if has_technical:
             dependencies.append("Technical infrastructure must be stable before optimization")
 
-        # Look for sequential implementation needs
-        for result in results:
-            if "foundation" in result.title.lower() or "basic" in result.title.lower():
-                dependencies.append(f"Complete '{result.title}' before advanced optimizations")
-
-        return dependencies if dependencies else ["No major dependencies identified"]
-
-    def _define_success_metrics(self, results: List[AnalysisResult], website_data: WebsiteData) -> List[str]:
-        """
-        Define success metrics for the implementation plan.
-        """
-        metrics = set()
-
-        # Add metrics based on result types
-        result_types = [result.type.lower() for result in results]
+        for title in foundation_titles:
+            dependencies.append(f"Complete '{title}' before advanced optimizations")
 
-        if any("seo" in t or "schema" in t for t in result_types):
-            metrics.add("Search engine ranking improvements")
-            metrics.add("Rich snippet appearance in search results")
-
-        if any("performance" in t or "speed" in t for t in result_types):
-            metrics.add("Page load speed improvements")
-            metrics.add("Core Web Vitals scores")
-
-        if any("content" in t or "user" in t for t in result_types):
-            metrics.add("User engagement metrics (time on page, bounce rate)")
-            metrics.add("Conversion rate improvements")
-
-        if any("business" in t or "accuracy" in t for t in result_types):
-            metrics.add("Business information accuracy score")
-            metrics.add("Local search visibility")
+        # Add defaults where nothing was identified
+        if not resources:
+            resources.update(_DEFAULT_RESOURCES)
 
-        if any("accessibility" in t for t in result_types):
-            metrics.add("Accessibility compliance score")
-            metrics.add("User experience improvements")
+        if not dependencies:
+            dependencies.extend(_DEFAULT_DEPENDENCIES)
 
-        # Add default metrics if none identified
         if not metrics:
-            metrics.add("Overall website quality score")
-            metrics.add("Implementation completion rate")
-
-        return sorted(list(metrics))
-
-    def _initialize_impact_weights(self) -> Dict[ImpactLevel, float]:
-        """
-        Initialize impact level weights for calculations.
-        """
-        return {
-            ImpactLevel.LOW: 0.25,
-            ImpactLevel.MEDIUM: 0.5,
-            ImpactLevel.HIGH: 0.75,
-            ImpactLevel.CRITICAL: 1.0
-        }
+            metrics.update(_DEFAULT_METRICS)
 
-    def _initialize_effort_weights(self) -> Dict[EffortLevel, float]:
-        """
-        Initialize effort level weights for calculations.
-        """
-        return {
-            EffortLevel.LOW: 0.25,
-            EffortLevel.MEDIUM: 0.5,
-            EffortLevel.HIGH: 0.75,
-            EffortLevel.VERY_HIGH: 1.0
-        }
+        return sorted(resources), dependencies, sorted(metrics)
@@ -4,12 +4,20 @@ Focuses on data consistency validation, business information accuracy,
 and canonical data creation across multiple sources.
 """
 
+import asyncio
+import copy
+import functools
+import hashlib
+import multiprocessing
+import os
 import time
 import re
+from dataclasses import dataclass
 from typing import Dict, Any, List, Optional, Tuple
-from collections import Counter
-import difflib
-from bs4 import BeautifulSoup
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from types import MappingProxyType
+from bs4 import BeautifulSoup, Tag
 
 from ..shared.base_agent import BaseAgent
 from ..shared.models import (
@@ -21,6 +29,133 @@ from .analyzer import GEOAnalyzer
 from .generator import GEOGenerator
 from .validator import GEOValidator
 
+try:
+    import lxml  # noqa: F401
+    _HTML_PARSER = 'lxml'
+except ImportError:  # optional speedup; the pure-Python parser is used otherwise
+    _HTML_PARSER = 'html.parser'
+
+
+# Contact extraction patterns, compiled once for every page analysed
+_PHONE_RE = re.compile(r'\b(?:\+?1[-.\s]?)?\(?([0-9]{3})\)?[-.\s]?([0-9]{3})[-.\s]?([0-9]{4})\b')
+_EMAIL_RE = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9-]+(?:\.[A-Za-z0-9-]+)*\.[A-Za-z]{2,}\b')
+# Address spans are bounded and lazy so long period-free text cannot make them
+# backtrack quadratically; the match ends at the first ZIP (or ZIP+4) found
+_ADDR_RES = [
+    re.compile(p, re.IGNORECASE) for p in (
+        r'\b\d+\s+[A-Za-z][A-Za-z\s]{0,60}?(?:Street|St|Avenue|Ave|Road|Rd|Drive|Dr|Boulevard|Blvd|Lane|Ln|Way|Court|Ct)\b[^.]{0,80}?(?:[A-Z]{2}\s+)?\d{5}(?:-\d{4})?',
+        r'\b[A-Z][a-z]+\s+University\b[^.]{0,80}?(?:[A-Z]{2}\s+)?\d{5}(?:-\d{4})?'
+    )
+]
+# Every address pattern ends in a ZIP code, so a cheap digit scan lets pages
+# without one skip the patterns above
+_ZIP_RE = re.compile(r'\d{5}')
+
+# Contact details sit near the top or in the footer of real pages; scanning at
+# most this many characters bounds regex cost on bloated or hostile pages
+_MAX_EXTRACTION_CHARS = 256 * 1024
+
+# Title suffix separators ("Name | Tagline", "Name - City"); the earliest one wins
+_TITLE_SEP_RE = re.compile(r' [|-] ')
+
+# Contact accessibility patterns
+_CONTACT_TEXT_RE = re.compile(r'contact', re.IGNORECASE)
+
+# Social media hosts in priority order for hrefs naming several (e.g. share links);
+# x.com links are reported under twitter. The regex only prefilters anchors.
+_SOCIAL_HOSTS = (
+    ('linkedin.com', 'linkedin'),
+    ('instagram.com', 'instagram'),
+    ('facebook.com', 'facebook'),
+    ('twitter.com', 'twitter'),
+    ('x.com', 'twitter'),
+)
+_SOCIAL_RE = re.compile(r'(?:linkedin|instagram|facebook|twitter|x)\.com')
+_SOCIAL_PLATFORM_COUNT = 4  # linkedin, instagram, facebook, twitter
+
+# Data quality factors, in the order _assess_data_quality checks them
+_QUALITY_FACTOR_NAMES = (
+    "name_quality", "phone_quality", "email_quality",
+    "address_quality", "social_presence", "website_quality"
+)
+
+# Implementation steps for the legacy GEO checks; AnalysisResult copies them into lists
+_STEPS_MISSING_INFO = (
+    "Add missing contact information to website",
+    "Ensure information is prominently displayed",
+    "Include contact details in footer or header",
+    "Add structured data markup for business info"
+)
+_STEPS_CONTACT_ACCESS = (
+    "Add contact info to header and footer",
+    "Make phone numbers clickable with tel: links",
+    "Make email addresses clickable with mailto: links",
+    "Create dedicated contact page",
+    "Add contact information to schema markup"
+)
+_STEPS_LOW_QUALITY = (
+    "Complete missing business information fields",
+    "Validate existing contact information",
+    "Add social media links",
+    "Ensure information accuracy across all pages",
+    "Implement data validation procedures"
+)
+_STEPS_EXTERNAL = (
+    "Claim and verify Google My Business listing",
+    "Create consistent social media profiles",
+    "Ensure NAP (Name, Address, Phone) consistency across platforms",
+    "Monitor and respond to reviews",
+    "Set up regular monitoring of external mentions"
+)
+_STEPS_CANONICAL = (
+    "Define canonical business information format",
+    "Implement JSON-LD structured data",
+    "Standardize contact information display",
+    "Create master data source/template",
+    "Implement data validation procedures"
+)
+
+# Data validators are stateless, so every agent shares one set
+_DATA_VALIDATORS = MappingProxyType({
+    "phone": re.compile(r'^\(\d{3}\)\s\d{3}-\d{4}$'),
+    "email": re.compile(r'^[^@]+@[^@]+\.[^@]+$'),
+    "url": re.compile(r'^https?://[^\s]+$')
+})
+
+
+@functools.lru_cache(maxsize=1024)
+def _domain_business_name(host: str) -> str:
+    """Derive a fallback business name from a host, e.g. www.acme.com -> Acme."""
+    return host.removeprefix('www.').split('.', 1)[0].title()
+
+
+@dataclass(slots=True)
+class DomCache:
+    """Page elements shared by the legacy extraction and contact validation steps."""
+    soup: BeautifulSoup
+    header: Optional[Tag]
+    footer: Optional[Tag]
+    anchors: List[Tag]
+    text: str
+    has_contact_word: bool
+
+    @classmethod
+    def from_soup(cls, soup: BeautifulSoup) -> "DomCache":
+        """Collect everything the legacy checks need in one tag walk plus one text walk."""
+        header = footer = None
+        anchors = []
+        for tag in soup.find_all(('header', 'footer', 'a')):
+            if tag.name == 'a':
+                if tag.get('href') is not None:
+                    anchors.append(tag)
+            elif tag.name == 'header':
+                if header is None:
+                    header = tag
+            elif footer is None:
+                footer = tag
+        text = soup.get_text()
+        return cls(soup, header, footer, anchors, text, _CONTACT_TEXT_RE.search(text) is not None)
+
 
 class GEOAgent(BaseAgent):
     """
@@ -33,12 +168,16 @@ class GEOAgent(BaseAgent):
     - Cross-reference validation with external sources
     """
     
+    # LRU bound on cached legacy analyses (entries)
+    _ANALYSIS_CACHE_SIZE = 256
+    
     def __init__(self, llm_client: LLMClient):
         super().__init__("GEO Agent", llm_client)
         self.analyzer = GEOAnalyzer(llm_client)
         self.generator = GEOGenerator(llm_client)
         self.validator = GEOValidator(llm_client)
         self.data_validators = self._initialize_validators()
+        self._analysis_cache = OrderedDict()
         
     def get_agent_type(self) -> str:
         return AgentType.GEO
@@ -59,10 +198,14 @@ class GEOAgent(BaseAgent):
         
         try:
             # Use the new analyzer for comprehensive business information analysis
-            business_analysis = self.analyzer.analyze_business_information(website_data)
-            contact_analysis = self.analyzer.analyze_contact_accuracy(website_data)
-            location_analysis = self.analyzer.analyze_location_accuracy(website_data)
-            credibility_analysis = self.analyzer.analyze_business_credibility(website_data)
+            # The CPU-bound analyzers run in worker threads while the LLM-backed
+            # business analysis waits on the network
+            business_analysis, contact_analysis, location_analysis, credibility_analysis = await asyncio.gather(
+                self.analyzer.analyze_business_information(website_data),
+                asyncio.to_thread(self.analyzer.analyze_contact_accuracy, website_data),
+                asyncio.to_thread(self.analyzer.analyze_location_accuracy, website_data),
+                asyncio.to_thread(self.analyzer.analyze_business_credibility, website_data)
+            )
             
             # Generate standardized business data and improvements
             business_data = self.generator.generate_business_data(business_analysis, client_input)
@@ -133,6 +276,44 @@ class GEOAgent(BaseAgent):
                 processing_time=processing_time
             )
     
+    async def analyze_batch(self, websites: List[WebsiteData], max_workers: Optional[int] = None) -> List[AgentResponse]:
+        """
+        Run the legacy analysis over many websites in parallel worker processes.
+        
+        Parsing and regex extraction are CPU-bound, so separate processes sidestep
+        the GIL. Workers are spawned rather than forked, since this process already
+        runs event-loop and to_thread threads, and each builds its own agent with
+        this agent's model and the ANTHROPIC_API_KEY from the environment. The pool
+        lives only for this call, so pass many websites per call to amortize worker
+        start-up; single websites, or runs without the key in the environment,
+        are analyzed in-process.
+        
+        Args:
+            websites: Websites to analyze
+            max_workers: Worker process count (defaults to the CPU count)
+            
+        Returns:
+            One AgentResponse per website, in input order
+        """
+        if len(websites) < 2 or not os.getenv("ANTHROPIC_API_KEY"):
+            return [await self.analyze_legacy(website_data) for website_data in websites]
+        
+        loop = asyncio.get_running_loop()
+        executor = ProcessPoolExecutor(
+            max_workers=max_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_batch_worker,
+            initargs=(self.llm_client.model,)
+        )
+        try:
+            return list(await asyncio.gather(*(
+                loop.run_in_executor(executor, _analyze_legacy_in_worker, website_data)
+                for website_data in websites
+            )))
+        finally:
+            # Joining the workers blocks, so keep it off the event loop
+            await asyncio.to_thread(executor.shutdown, wait=True, cancel_futures=True)
+    
     async def analyze_legacy(self, website_data: WebsiteData) -> AgentResponse:
         """
         Legacy analyze method for backward compatibility.
@@ -141,32 +322,52 @@ class GEOAgent(BaseAgent):
         self._log_analysis_start(str(website_data.url))
         
         try:
+            # The analysis depends only on the URL and the page, so repeat crawls
+            # of an unchanged page reuse the previous results
+            cache_key = hashlib.blake2b(
+                str(website_data.url).encode() + b"\0" + website_data.html_content.encode(),
+                digest_size=16
+            ).digest()
+            cached = self._analysis_cache.get(cache_key)
+            if cached is not None:
+                self._analysis_cache.move_to_end(cache_key)
+                results, confidence, metadata = copy.deepcopy(cached)
+                self._log_analysis_complete(str(website_data.url), len(results), confidence)
+                return self._create_response(
+                    results=results,
+                    confidence=confidence,
+                    processing_time=time.time() - start_time,
+                    metadata=metadata
+                )
+            
             results = []
             
             # Parse HTML content
-            soup = BeautifulSoup(website_data.html_content, 'html.parser')
+            soup = BeautifulSoup(website_data.html_content, _HTML_PARSER)
+            dom = DomCache.from_soup(soup)
             
             # Extract business information from current page
-            business_info = self._extract_business_information(soup, website_data)
+            business_info = self._extract_business_information(dom, website_data)
+            business_data = business_info.model_dump()
             
             # 1. Business information consistency analysis
-            consistency_results = await self._analyze_business_consistency(business_info, website_data)
+            consistency_results = self._analyze_business_consistency(business_info, website_data)
             results.extend(consistency_results)
             
             # 2. Contact information validation
-            contact_results = await self._validate_contact_information(business_info, soup)
+            contact_results = self._validate_contact_information(business_info, dom)
             results.extend(contact_results)
             
             # 3. Data quality assessment
-            quality_results = await self._assess_data_quality(business_info, website_data)
+            quality_results = self._assess_data_quality(business_info, website_data)
             results.extend(quality_results)
             
             # 4. External validation opportunities
-            external_results = await self._identify_external_validation_opportunities(business_info)
+            external_results = self._identify_external_validation_opportunities(business_info)
             results.extend(external_results)
             
             # 5. Canonical data recommendations
-            canonical_results = await self._generate_canonical_data_recommendations(business_info)
+            canonical_results = self._generate_canonical_data_recommendations(business_info, business_data)
             results.extend(canonical_results)
             
             processing_time = time.time() - start_time
@@ -174,18 +375,25 @@ class GEOAgent(BaseAgent):
             
             self._log_analysis_complete(str(website_data.url), len(results), confidence)
             
+            metadata = {
+                "business_info_extracted": business_data,
+                "validation_categories": [
+                    "business_consistency", "contact_validation", "data_quality",
+                    "external_validation", "canonical_data"
+                ],
+                "data_completeness_score": self._calculate_data_completeness(business_info)
+            }
+            
+            # Only successful analyses are cached; errors are retried next time
+            self._analysis_cache[cache_key] = copy.deepcopy((results, confidence, metadata))
+            if len(self._analysis_cache) > self._ANALYSIS_CACHE_SIZE:
+                self._analysis_cache.popitem(last=False)
+            
             return self._create_response(
                 results=results,
                 confidence=confidence,
                 processing_time=processing_time,
-                metadata={
-                    "business_info_extracted": business_info.dict() if business_info else {},
-                    "validation_categories": [
-                        "business_consistency", "contact_validation", "data_quality",
-                        "external_validation", "canonical_data"
-                    ],
-                    "data_completeness_score": self._calculate_data_completeness(business_info)
-                }
+                metadata=metadata
             )
             
         except Exception as e:
@@ -198,56 +406,48 @@ class GEOAgent(BaseAgent):
                 processing_time=processing_time
             )
     
-    def _extract_business_information(self, soup: BeautifulSoup, website_data: WebsiteData) -> BusinessInfo:
+    def _extract_business_information(self, dom: DomCache, website_data: WebsiteData) -> BusinessInfo:
         """Extract business information from webpage."""
         business_info = BusinessInfo()
         
         # Extract business name
-        business_info.name = self._extract_business_name(soup, website_data)
+        business_info.name = self._extract_business_name(dom.soup, website_data)
         
         # Extract contact information
-        text_content = soup.get_text()
+        text_content = dom.text[:_MAX_EXTRACTION_CHARS]
         
-        # Phone number extraction
-        phone_matches = re.findall(r'\b(?:\+?1[-.\s]?)?\(?([0-9]{3})\)?[-.\s]?([0-9]{3})[-.\s]?([0-9]{4})\b', text_content)
-        if phone_matches:
-            phone = '-'.join(phone_matches[0])
-            business_info.phone = f"({phone_matches[0][0]}) {phone_matches[0][1]}-{phone_matches[0][2]}"
+        # Phone number extraction (only the first match is used, so stop there)
+        phone_match = _PHONE_RE.search(text_content)
+        if phone_match:
+            business_info.phone = "({}) {}-{}".format(*phone_match.groups())
         
         # Email extraction
-        email_matches = re.findall(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b', text_content)
-        if email_matches:
-            business_info.email = email_matches[0]
+        email_match = _EMAIL_RE.search(text_content)
+        if email_match:
+            business_info.email = email_match.group()
         
         # Address extraction (basic pattern)
-        address_patterns = [
-            r'\b\d+\s+[A-Za-z\s]+(?:Street|St|Avenue|Ave|Road|Rd|Drive|Dr|Boulevard|Blvd|Lane|Ln|Way|Court|Ct)\b[^.]*(?:[A-Z]{2}\s+\d{5}|\d{5})',
-            r'\b[A-Z][a-z]+\s+University\b[^.]*(?:[A-Z]{2}\s+\d{5}|\d{5})'
-        ]
-        
-        for pattern in address_patterns:
-            address_matches = re.findall(pattern, text_content, re.IGNORECASE)
-            if address_matches:
-                business_info.address = address_matches[0]
-                break
+        if _ZIP_RE.search(text_content):
+            for pattern in _ADDR_RES:
+                address_match = pattern.search(text_content)
+                if address_match:
+                    business_info.address = address_match.group()
+                    break
         
         # Website URL
         business_info.website = str(website_data.url)
         
-        # Extract social media links
-        social_links = soup.find_all('a', href=True)
+        # Extract social media links; the last link per platform is kept, so walk
+        # the anchors backwards and stop once every platform has one
         social_media = {}
         
-        for link in social_links:
+        for link in reversed(dom.anchors):
             href = link['href']
-            if 'linkedin.com' in href:
-                social_media['linkedin'] = href
-            elif 'instagram.com' in href:
-                social_media['instagram'] = href
-            elif 'facebook.com' in href:
-                social_media['facebook'] = href
-            elif 'twitter.com' in href or 'x.com' in href:
-                social_media['twitter'] = href
+            if _SOCIAL_RE.search(href):
+                platform = next(platform for host, platform in _SOCIAL_HOSTS if host in href)
+                social_media.setdefault(platform, href)
+                if len(social_media) == _SOCIAL_PLATFORM_COUNT:
+                    break
         
         business_info.social_media = social_media
         
@@ -264,7 +464,7 @@ class GEOAgent(BaseAgent):
         
         return business_info
     
-    async def _analyze_business_consistency(self, business_info: BusinessInfo, website_data: WebsiteData) -> List[AnalysisResult]:
+    def _analyze_business_consistency(self, business_info: BusinessInfo, website_data: WebsiteData) -> List[AnalysisResult]:
         """Analyze business information consistency."""
         results = []
         
@@ -290,12 +490,7 @@ class GEOAgent(BaseAgent):
                 impact=ImpactLevel.HIGH,
                 effort=EffortLevel.LOW,
                 recommendation=f"Add missing business information: {', '.join(missing_info)}",
-                implementation_steps=[
-                    "Add missing contact information to website",
-                    "Ensure information is prominently displayed",
-                    "Include contact details in footer or header",
-                    "Add structured data markup for business info"
-                ],
+                implementation_steps=_STEPS_MISSING_INFO,
                 confidence=0.9,
                 metadata={
                     "missing_fields": missing_info,
@@ -305,7 +500,7 @@ class GEOAgent(BaseAgent):
         
         return results
     
-    async def _validate_contact_information(self, business_info: BusinessInfo, soup: BeautifulSoup) -> List[AnalysisResult]:
+    def _validate_contact_information(self, business_info: BusinessInfo, dom: DomCache) -> List[AnalysisResult]:
         """Validate contact information accuracy and accessibility."""
         results = []
         
@@ -316,28 +511,21 @@ class GEOAgent(BaseAgent):
         contact_locations = []
         
         # Look for contact info in common locations
-        header = soup.find('header')
-        footer = soup.find('footer')
-        contact_page_indicators = soup.find_all(text=re.compile(r'contact', re.IGNORECASE))
-        
-        if header and (business_info.phone or business_info.email):
+        if dom.header and (business_info.phone or business_info.email):
             contact_locations.append("header")
-        if footer and (business_info.phone or business_info.email):
+        if dom.footer and (business_info.phone or business_info.email):
             contact_locations.append("footer")
-        if contact_page_indicators:
+        if dom.has_contact_word:
             contact_locations.append("contact_page")
         
         if len(contact_locations) < 2:
             accessibility_issues.append("Contact information not prominently displayed")
         
         # Check for click-to-call/email functionality
-        phone_links = soup.find_all('a', href=re.compile(r'^tel:'))
-        email_links = soup.find_all('a', href=re.compile(r'^mailto:'))
-        
-        if business_info.phone and not phone_links:
+        if business_info.phone and not any(a['href'].startswith('tel:') for a in dom.anchors):
             accessibility_issues.append("Phone number not linked for click-to-call")
         
-        if business_info.email and not email_links:
+        if business_info.email and not any(a['href'].startswith('mailto:') for a in dom.anchors):
             accessibility_issues.append("Email not linked for click-to-email")
         
         if accessibility_issues:
@@ -350,13 +538,7 @@ class GEOAgent(BaseAgent):
                 impact=ImpactLevel.MEDIUM,
                 effort=EffortLevel.LOW,
                 recommendation="Improve contact information accessibility",
-                implementation_steps=[
-                    "Add contact info to header and footer",
-                    "Make phone numbers clickable with tel: links",
-                    "Make email addresses clickable with mailto: links",
-                    "Create dedicated contact page",
-                    "Add contact information to schema markup"
-                ],
+                implementation_steps=_STEPS_CONTACT_ACCESS,
                 confidence=0.8,
                 metadata={
                     "accessibility_issues": accessibility_issues,
@@ -366,23 +548,29 @@ class GEOAgent(BaseAgent):
         
         return results
     
-    async def _assess_data_quality(self, business_info: BusinessInfo, website_data: WebsiteData) -> List[AnalysisResult]:
+    def _assess_data_quality(self, business_info: BusinessInfo, website_data: WebsiteData) -> List[AnalysisResult]:
         """Assess overall data quality and completeness."""
         results = []
         
         # Calculate data quality score
-        quality_factors = {
-            "name_quality": 1.0 if business_info.name and len(business_info.name) > 2 else 0.0,
-            "phone_quality": 1.0 if business_info.phone and len(business_info.phone) >= 10 else 0.0,
-            "email_quality": 1.0 if business_info.email and '@' in business_info.email else 0.0,
-            "address_quality": 1.0 if business_info.address and len(business_info.address) > 10 else 0.0,
-            "social_presence": 1.0 if business_info.social_media else 0.0,
-            "website_quality": 1.0 if business_info.website else 0.0
-        }
+        name, phone, email, address = business_info.name, business_info.phone, business_info.email, business_info.address
+        quality_flags = (
+            bool(name) and len(name) > 2,
+            bool(phone) and len(phone) >= 10,
+            bool(email) and '@' in email,
+            bool(address) and len(address) > 10,
+            bool(business_info.social_media),
+            bool(business_info.website)
+        )
         
-        overall_quality = sum(quality_factors.values()) / len(quality_factors)
+        overall_quality = sum(quality_flags) / len(quality_flags)
         
         if overall_quality < 0.7:
+            # Per-factor scores are only reported when the page falls short
+            quality_factors = {
+                factor: 1.0 if flag else 0.0
+                for factor, flag in zip(_QUALITY_FACTOR_NAMES, quality_flags)
+            }
             results.append(AnalysisResult(
                 id="low_data_quality",
                 type="data_quality",
@@ -392,13 +580,7 @@ class GEOAgent(BaseAgent):
                 impact=ImpactLevel.HIGH,
                 effort=EffortLevel.MEDIUM,
                 recommendation="Improve data completeness and quality",
-                implementation_steps=[
-                    "Complete missing business information fields",
-                    "Validate existing contact information",
-                    "Add social media links",
-                    "Ensure information accuracy across all pages",
-                    "Implement data validation procedures"
-                ],
+                implementation_steps=_STEPS_LOW_QUALITY,
                 confidence=0.9,
                 metadata={
                     "quality_score": overall_quality,
@@ -409,7 +591,7 @@ class GEOAgent(BaseAgent):
         
         return results
     
-    async def _identify_external_validation_opportunities(self, business_info: BusinessInfo) -> List[AnalysisResult]:
+    def _identify_external_validation_opportunities(self, business_info: BusinessInfo) -> List[AnalysisResult]:
         """Identify opportunities for external validation."""
         results = []
         
@@ -449,20 +631,14 @@ class GEOAgent(BaseAgent):
                 impact=ImpactLevel.MEDIUM,
                 effort=EffortLevel.HIGH,
                 recommendation="Establish and validate presence on external platforms",
-                implementation_steps=[
-                    "Claim and verify Google My Business listing",
-                    "Create consistent social media profiles",
-                    "Ensure NAP (Name, Address, Phone) consistency across platforms",
-                    "Monitor and respond to reviews",
-                    "Set up regular monitoring of external mentions"
-                ],
+                implementation_steps=_STEPS_EXTERNAL,
                 confidence=0.8,
                 metadata={"opportunities": external_opportunities}
             ))
         
         return results
     
-    async def _generate_canonical_data_recommendations(self, business_info: BusinessInfo) -> List[AnalysisResult]:
+    def _generate_canonical_data_recommendations(self, business_info: BusinessInfo, business_data: Dict[str, Any]) -> List[AnalysisResult]:
         """Generate recommendations for canonical data creation."""
         results = []
         
@@ -494,17 +670,11 @@ class GEOAgent(BaseAgent):
                     impact=ImpactLevel.HIGH,
                     effort=EffortLevel.MEDIUM,
                     recommendation="Create and implement canonical business data standards",
-                    implementation_steps=[
-                        "Define canonical business information format",
-                        "Implement JSON-LD structured data",
-                        "Standardize contact information display",
-                        "Create master data source/template",
-                        "Implement data validation procedures"
-                    ],
+                    implementation_steps=_STEPS_CANONICAL,
                     confidence=0.8,
                     metadata={
                         "recommendations": canonical_recommendations,
-                        "business_data": business_info.dict()
+                        "business_data": business_data
                     }
                 ))
         
@@ -514,16 +684,18 @@ class GEOAgent(BaseAgent):
         """Extract business name from various sources."""
         # Try title tag first
         title_tag = soup.find('title')
-        if title_tag and title_tag.string:
+        title_string = title_tag.string if title_tag else None
+        if title_string:
             # Clean up title - remove common suffixes
-            title = title_tag.string.split(' | ')[0].split(' - ')[0].strip()
+            title = _TITLE_SEP_RE.split(title_string, maxsplit=1)[0].strip()
             if title and len(title) > 2:
                 return title
         
         # Try h1 tag
         h1_tag = soup.find('h1')
-        if h1_tag and h1_tag.get_text().strip():
-            return h1_tag.get_text().strip()
+        h1_text = h1_tag.get_text().strip() if h1_tag else ''
+        if h1_text:
+            return h1_text
         
         # Try meta property og:site_name
         og_site_name = soup.find('meta', property='og:site_name')
@@ -532,18 +704,13 @@ class GEOAgent(BaseAgent):
         
         # Fallback to domain name
         if website_data.url:
-            domain = str(website_data.url).replace('https://', '').replace('http://', '').split('.')[0]
-            return domain.replace('www', '').title()
+            return _domain_business_name(website_data.url.host or '')
         
         return None
     
     def _initialize_validators(self) -> Dict[str, Any]:
         """Initialize data validators."""
-        return {
-            "phone": re.compile(r'^\(\d{3}\)\s\d{3}-\d{4}$'),
-            "email": re.compile(r'^[^@]+@[^@]+\.[^@]+$'),
-            "url": re.compile(r'^https?://[^\s]+$')
-        }
+        return _DATA_VALIDATORS
     
     def _calculate_data_completeness(self, business_info: Optional[BusinessInfo]) -> float:
         """Calculate data completeness score."""
@@ -722,3 +889,18 @@ class GEOAgent(BaseAgent):
             recommendation="Review error and retry analysis",
             confidence=0.0
         )
+
+
+# Agent owned by each analyze_batch worker process
+_batch_worker_agent: Optional[GEOAgent] = None
+
+
+def _init_batch_worker(model: str) -> None:
+    """Build the per-process agent used by analyze_batch workers; credentials come from the environment."""
+    global _batch_worker_agent
+    _batch_worker_agent = GEOAgent(LLMClient(model=model))
+
+
+def _analyze_legacy_in_worker(website_data: WebsiteData) -> AgentResponse:
+    """Run the legacy analysis for one website inside a worker process."""
+    return asyncio.run(_batch_worker_agent.analyze_legacy(website_data))
@@ -2,14 +2,77 @@
 GEO Agent Analyzer - Analyzes website data for accuracy and business information validation.
 """
 
+import asyncio
 import json
 import re
+from collections import Counter
 from typing import Dict, Any, List, Optional, Tuple
 from urllib.parse import urlparse
 from bs4 import BeautifulSoup
 from ..shared.models import WebsiteData, BusinessInfo
 from ..shared.llm_client import LLMClient
 
+try:
+    import lxml  # noqa: F401
+    _HTML_PARSER = 'lxml'
+except ImportError:  # optional speedup; the pure-Python parser is used otherwise
+    _HTML_PARSER = 'html.parser'
+
+
+# Extraction patterns, compiled once rather than on every analyzer call
+_PHONE_RES = tuple(re.compile(p) for p in (
+    r'\b\d{3}[-.]?\d{3}[-.]?\d{4}\b',
+    r'\(\d{3}\)\s?\d{3}[-.]?\d{4}',
+    r'\b\d{3}\s\d{3}\s\d{4}\b'
+))
+_EMAIL_RE = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+_EMAIL_FULL_RE = re.compile(r'^[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}$')
+_ADDRESS_RES = tuple(re.compile(p, re.IGNORECASE) for p in (
+    r'\b\d+\s+[A-Za-z\s]+(?:Street|St|Avenue|Ave|Road|Rd|Boulevard|Blvd|Drive|Dr|Lane|Ln|Way)\b',
+    r'\b[A-Za-z\s]+,\s*[A-Z]{2}\s+\d{5}(?:-\d{4})?\b'
+))
+_HOURS_RES = tuple(re.compile(p, re.IGNORECASE | re.MULTILINE) for p in (
+    r'(?:mon|monday).*?(?:fri|friday).*?(\d{1,2}:\d{2}.*?\d{1,2}:\d{2})',
+    r'hours?:?\s*(.+?)(?:\n|$)',
+    r'open:?\s*(.+?)(?:\n|$)',
+    r'(\d{1,2}:\d{2}.*?-.*?\d{1,2}:\d{2})'
+))
+_TITLE_SUFFIX_RE = re.compile(r'\s*[-|]\s*.*$')
+_META_SEPARATOR_RE = re.compile(r'[-|:]')
+_COPYRIGHT_RE = re.compile(r'©.*?(\w+(?:\s+\w+)*)')
+
+# Page section and social link patterns matched against class and href attributes
+_CONTACT_CLASS_RE = re.compile(r'contact', re.I)
+_ABOUT_CLASS_RE = re.compile(r'about', re.I)
+_SOCIAL_CLASS_RE = re.compile(r'social', re.I)
+_SOCIAL_PLATFORM_RES = tuple(
+    (platform, re.compile(platform, re.I))
+    for platform in ('facebook', 'twitter', 'instagram', 'linkedin', 'youtube', 'tiktok')
+)
+
+# NAP values are bucketed by normalized form, so "(555) 123-4567" and
+# "555.123.4567" count as one phone number rather than an inconsistency
+_NON_DIGIT_RE = re.compile(r'\D')
+_NON_WORD_RE = re.compile(r'[\W_]+')
+
+
+def _normalize_phone(phone: str) -> str:
+    """Reduce a phone number to its digits."""
+    return _NON_DIGIT_RE.sub('', phone)
+
+
+def _normalize_text(value: str) -> str:
+    """Lowercase a name or address and collapse punctuation and whitespace."""
+    return _NON_WORD_RE.sub(' ', value).strip().lower()
+
+
+# (variations key, field name, normalizer) for each NAP component
+_NAP_FIELDS = (
+    ("name_variations", "name", _normalize_text),
+    ("address_variations", "address", _normalize_text),
+    ("phone_variations", "phone", _normalize_phone)
+)
+
 
 class GEOAnalyzer:
     """
@@ -128,7 +191,7 @@ class GEOAnalyzer:
         if not website_data.html_content:
             return {"phones": [], "emails": [], "addresses": [], "completeness": 0.0}
         
-        soup = BeautifulSoup(website_data.html_content, 'html.parser')
+        soup = BeautifulSoup(website_data.html_content, _HTML_PARSER)
         text_content = soup.get_text()
         
         contact_info = {
@@ -149,7 +212,7 @@ class GEOAnalyzer:
         if not website_data.html_content:
             return {"primary_location": None, "service_areas": [], "accuracy": 0.0}
         
-        soup = BeautifulSoup(website_data.html_content, 'html.parser')
+        soup = BeautifulSoup(website_data.html_content, _HTML_PARSER)
         text_content = soup.get_text()
         
         location_data = {
@@ -179,14 +242,14 @@ class GEOAnalyzer:
             return nap_data
         
         # Extract NAP data from different page sections
-        soup = BeautifulSoup(website_data.html_content, 'html.parser')
+        soup = BeautifulSoup(website_data.html_content, _HTML_PARSER)
         
         # Check header, footer, contact sections
         sections = {
             "header": soup.find('header'),
             "footer": soup.find('footer'),
-            "contact": soup.find(class_=re.compile(r'contact', re.I)),
-            "about": soup.find(class_=re.compile(r'about', re.I))
+            "contact": soup.find(class_=_CONTACT_CLASS_RE),
+            "about": soup.find(class_=_ABOUT_CLASS_RE)
         }
         
         for section_name, section in sections.items():
@@ -196,8 +259,28 @@ class GEOAnalyzer:
                 nap_data["address_variations"].extend(self._extract_addresses_from_text(section_text))
                 nap_data["phone_variations"].extend(self._extract_phone_numbers(section_text))
         
+        # Bucket each component by normalized value; the most common bucket is
+        # canonical and any other bucket is reported as an inconsistency
+        buckets = {}
+        for key, field, normalize in _NAP_FIELDS:
+            counts = Counter()
+            originals = {}
+            for value in nap_data[key]:
+                normalized = normalize(value)
+                if normalized:
+                    counts[normalized] += 1
+                    originals.setdefault(normalized, value)
+            buckets[field] = counts
+            if len(counts) > 1:
+                canonical = counts.most_common(1)[0][0]
+                nap_data["inconsistencies"].append({
+                    "field": field,
+                    "canonical": originals[canonical],
+                    "variants": [originals[normalized] for normalized in counts if normalized != canonical]
+                })
+        
         # Calculate consistency score
-        nap_data["consistency_score"] = self._calculate_nap_consistency_score(nap_data)
+        nap_data["consistency_score"] = self._calculate_nap_consistency_score(buckets)
         
         return nap_data
     
@@ -213,19 +296,12 @@ class GEOAnalyzer:
         if not website_data.html_content:
             return hours_data
         
-        soup = BeautifulSoup(website_data.html_content, 'html.parser')
+        soup = BeautifulSoup(website_data.html_content, _HTML_PARSER)
         text_content = soup.get_text()
         
         # Look for structured hours patterns
-        hours_patterns = [
-            r'(?:mon|monday).*?(?:fri|friday).*?(\d{1,2}:\d{2}.*?\d{1,2}:\d{2})',
-            r'hours?:?\s*(.+?)(?:\n|$)',
-            r'open:?\s*(.+?)(?:\n|$)',
-            r'(\d{1,2}:\d{2}.*?-.*?\d{1,2}:\d{2})'
-        ]
-        
-        for pattern in hours_patterns:
-            matches = re.findall(pattern, text_content, re.IGNORECASE | re.MULTILINE)
+        for pattern in _HOURS_RES:
+            matches = pattern.findall(text_content)
             hours_data["text_mentions"].extend(matches)
         
         # Check schema markup for hours
@@ -273,7 +349,7 @@ class GEOAnalyzer:
         if not website_data.html_content:
             return []
         
-        text_content = BeautifulSoup(website_data.html_content, 'html.parser').get_text()
+        text_content = BeautifulSoup(website_data.html_content, _HTML_PARSER).get_text()
         phone_numbers = self._extract_phone_numbers(text_content)
         
         validated_phones = []
@@ -293,7 +369,7 @@ class GEOAnalyzer:
         if not website_data.html_content:
             return []
         
-        text_content = BeautifulSoup(website_data.html_content, 'html.parser').get_text()
+        text_content = BeautifulSoup(website_data.html_content, _HTML_PARSER).get_text()
         email_addresses = self._extract_email_addresses(text_content)
         
         validated_emails = []
@@ -320,19 +396,17 @@ class GEOAnalyzer:
         if not website_data.html_content:
             return social_media
         
-        soup = BeautifulSoup(website_data.html_content, 'html.parser')
+        soup = BeautifulSoup(website_data.html_content, _HTML_PARSER)
         
         # Common social media platforms
-        platforms = ['facebook', 'twitter', 'instagram', 'linkedin', 'youtube', 'tiktok']
-        
-        for platform in platforms:
-            links = soup.find_all('a', href=re.compile(platform, re.I))
+        for platform, platform_re in _SOCIAL_PLATFORM_RES:
+            links = soup.find_all('a', href=platform_re)
             if links:
                 social_media["platforms"][platform] = [link.get('href') for link in links]
                 social_media["social_links"].extend([link.get('href') for link in links])
         
         # Count social media buttons/icons
-        social_media["social_buttons"] = len(soup.find_all(class_=re.compile(r'social', re.I)))
+        social_media["social_buttons"] = len(soup.find_all(class_=_SOCIAL_CLASS_RE))
         
         # Calculate presence score
         social_media["presence_score"] = min(len(social_media["platforms"]) / 3.0, 1.0)
@@ -351,7 +425,7 @@ class GEOAnalyzer:
         if not website_data.html_content:
             return form_analysis
         
-        soup = BeautifulSoup(website_data.html_content, 'html.parser')
+        soup = BeautifulSoup(website_data.html_content, _HTML_PARSER)
         forms = soup.find_all('form')
         
         form_analysis["forms_count"] = len(forms)
@@ -432,40 +506,28 @@ class GEOAnalyzer:
     
     def _extract_phone_numbers(self, text: str) -> List[str]:
         """Extract phone numbers from text."""
-        phone_patterns = [
-            r'\b\d{3}[-.]?\d{3}[-.]?\d{4}\b',
-            r'\(\d{3}\)\s?\d{3}[-.]?\d{4}',
-            r'\b\d{3}\s\d{3}\s\d{4}\b'
-        ]
-        
         phones = []
-        for pattern in phone_patterns:
-            phones.extend(re.findall(pattern, text))
+        for pattern in _PHONE_RES:
+            phones.extend(pattern.findall(text))
         
         return list(set(phones))
     
     def _extract_email_addresses(self, text: str) -> List[str]:
         """Extract email addresses from text."""
-        email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-        return re.findall(email_pattern, text)
+        return _EMAIL_RE.findall(text)
     
     def _extract_addresses_from_text(self, text: str) -> List[str]:
         """Extract addresses from text."""
-        address_patterns = [
-            r'\b\d+\s+[A-Za-z\s]+(?:Street|St|Avenue|Ave|Road|Rd|Boulevard|Blvd|Drive|Dr|Lane|Ln|Way)\b',
-            r'\b[A-Za-z\s]+,\s*[A-Z]{2}\s+\d{5}(?:-\d{4})?\b'
-        ]
-        
         addresses = []
-        for pattern in address_patterns:
-            addresses.extend(re.findall(pattern, text, re.IGNORECASE))
+        for pattern in _ADDRESS_RES:
+            addresses.extend(pattern.findall(text))
         
         return addresses
     
     def _extract_name_from_title(self, title: str) -> str:
         """Extract business name from title tag."""
         # Remove common suffixes and clean up
-        cleaned = re.sub(r'\s*[-|]\s*.*$', '', title)
+        cleaned = _TITLE_SUFFIX_RE.sub('', title)
         return cleaned.strip()
     
     def _extract_name_from_headers(self, html_content: str) -> str:
@@ -473,7 +535,7 @@ class GEOAnalyzer:
         if not html_content:
             return ""
         
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = BeautifulSoup(html_content, _HTML_PARSER)
         h1_tags = soup.find_all('h1')
         
         if h1_tags:
@@ -495,7 +557,7 @@ class GEOAnalyzer:
     def _extract_name_from_meta(self, meta_description: str) -> str:
         """Extract business name from meta description."""
         # Simple extraction - first few words before common separators
-        parts = re.split(r'[-|:]', meta_description)
+        parts = _META_SEPARATOR_RE.split(meta_description)
         if parts:
             return parts[0].strip()
         return ""
@@ -505,13 +567,13 @@ class GEOAnalyzer:
         if not html_content:
             return ""
         
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = BeautifulSoup(html_content, _HTML_PARSER)
         footer = soup.find('footer')
         
         if footer:
             footer_text = footer.get_text()
             # Look for copyright statements
-            copyright_match = re.search(r'©.*?(\w+(?:\s+\w+)*)', footer_text)
+            copyright_match = _COPYRIGHT_RE.search(footer_text)
             if copyright_match:
                 return copyright_match.group(1).strip()
         
@@ -589,36 +651,18 @@ class GEOAnalyzer:
         
         return sum(accuracy_factors) / len(accuracy_factors)
     
-    def _calculate_nap_consistency_score(self, nap_data: Dict[str, Any]) -> float:
-        """Calculate NAP consistency score."""
+    def _calculate_nap_consistency_score(self, buckets: Dict[str, Counter]) -> float:
+        """Calculate NAP consistency score from the normalized name, address and phone buckets."""
         consistency_scores = []
         
-        # Name consistency
-        unique_names = set(nap_data["name_variations"])
-        if len(unique_names) <= 1:
-            consistency_scores.append(1.0)
-        elif len(unique_names) <= 2:
-            consistency_scores.append(0.7)
-        else:
-            consistency_scores.append(0.3)
-        
-        # Address consistency
-        unique_addresses = set(nap_data["address_variations"])
-        if len(unique_addresses) <= 1:
-            consistency_scores.append(1.0)
-        elif len(unique_addresses) <= 2:
-            consistency_scores.append(0.7)
-        else:
-            consistency_scores.append(0.3)
-        
-        # Phone consistency
-        unique_phones = set(nap_data["phone_variations"])
-        if len(unique_phones) <= 1:
-            consistency_scores.append(1.0)
-        elif len(unique_phones) <= 2:
-            consistency_scores.append(0.7)
-        else:
-            consistency_scores.append(0.3)
+        for field in ("name", "address", "phone"):
+            distinct_values = len(buckets[field])
+            if distinct_values <= 1:
+                consistency_scores.append(1.0)
+            elif distinct_values <= 2:
+                consistency_scores.append(0.7)
+            else:
+                consistency_scores.append(0.3)
         
         return sum(consistency_scores) / len(consistency_scores)
     
@@ -643,7 +687,7 @@ class GEOAnalyzer:
     def _format_phone_number(self, phone: str) -> str:
         """Format phone number to standard format."""
         # Remove all non-digit characters
-        digits = re.sub(r'\D', '', phone)
+        digits = _NON_DIGIT_RE.sub('', phone)
         
         # Format as (XXX) XXX-XXXX for 10-digit numbers
         if len(digits) == 10:
@@ -655,12 +699,12 @@ class GEOAnalyzer:
     
     def _is_valid_phone_number(self, phone: str) -> bool:
         """Validate phone number format."""
-        digits = re.sub(r'\D', '', phone)
+        digits = _NON_DIGIT_RE.sub('', phone)
         return len(digits) in [10, 11] and (len(digits) != 11 or digits[0] == '1')
     
     def _determine_phone_type(self, phone: str) -> str:
         """Determine phone type (office, mobile, toll-free, etc.)."""
-        digits = re.sub(r'\D', '', phone)
+        digits = _NON_DIGIT_RE.sub('', phone)
         
         if len(digits) >= 10:
             area_code = digits[-10:-7] if len(digits) == 10 else digits[-10:-7]
@@ -677,8 +721,7 @@ class GEOAnalyzer:
     
     def _is_valid_email(self, email: str) -> bool:
         """Validate email address format."""
-        email_pattern = r'^[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}$'
-        return bool(re.match(email_pattern, email))
+        return bool(_EMAIL_FULL_RE.match(email))
     
     def _determine_email_type(self, email: str) -> str:
         """Determine email type (general, support, sales, etc.)."""
@@ -807,21 +850,21 @@ class GEOAnalyzer:
                     "phone": llm_info["contact_info"].get("phone")
                 })
             
-            # Analyze NAP consistency with LLM
-            if len(nap_data) > 1:
-                nap_consistency = await self.llm_client.analyze_nap_consistency(nap_data)
-                analysis_result["llm_nap_analysis"] = nap_consistency
-            
             # Get LLM recommendations for improvements
             content_summary = {
                 "business_name": analysis_result["business_name"],
                 "contact_info": analysis_result["contact_information"],
                 "location_data": analysis_result["location_data"]
             }
+            llm_calls = [self.llm_client.validate_and_improve_content(content_summary, "business_information")]
+            
+            # Analyze NAP consistency with LLM, concurrently with the recommendations
+            if len(nap_data) > 1:
+                llm_calls.append(self.llm_client.analyze_nap_consistency(nap_data))
             
-            recommendations = await self.llm_client.validate_and_improve_content(
-                content_summary, "business_information"
-            )
+            recommendations, *nap_consistency = await asyncio.gather(*llm_calls)
+            if nap_consistency:
+                analysis_result["llm_nap_analysis"] = nap_consistency[0]
             analysis_result["llm_recommendations"] = recommendations
             
             return analysis_result
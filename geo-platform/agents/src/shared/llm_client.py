@@ -21,6 +21,12 @@ class LLMClient:
     LLM client for language model interactions using Anthropic's Claude.
     """
     
+    # Output token ceiling of the default model; batched prompts are sized to stay under it
+    _MAX_OUTPUT_TOKENS = 8192
+    
+    # Output tokens budgeted per website, as in extract_business_info
+    _EXTRACTION_TOKENS_PER_SITE = 2000
+    
     def __init__(self, api_key: Optional[str] = None, model: Optional[str] = None):
         self.api_key = api_key or os.getenv("ANTHROPIC_API_KEY")
         self.model = model or os.getenv("DEFAULT_MODEL", "claude-3-5-sonnet-20241022")
@@ -66,6 +72,30 @@ class LLMClient:
             self.logger.error(f"LLM generation error: {str(e)}")
             raise
     
+    async def generate_text_batch(self, prompts: List[str], max_concurrency: int = 16, **kwargs) -> List[Optional[str]]:
+        """
+        Generate text for several prompts concurrently.
+        
+        Args:
+            prompts: Input prompts for text generation
+            max_concurrency: Maximum number of requests in flight at once
+            **kwargs: Additional parameters passed to generate_text
+            
+        Returns:
+            Generated text responses, in prompt order; None for prompts whose request failed
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        async def generate(prompt: str) -> Optional[str]:
+            async with semaphore:
+                try:
+                    return await self.generate_text(prompt, **kwargs)
+                except Exception:
+                    # generate_text already logged the error; keep the other slots
+                    return None
+        
+        return list(await asyncio.gather(*(generate(prompt) for prompt in prompts)))
+    
     async def analyze_content(self, content: str, analysis_type: str) -> Dict[str, Any]:
         """
         Analyze content using Claude for specific analysis types.
@@ -138,6 +168,70 @@ class LLMClient:
             self.logger.error(f"Business info extraction error: {str(e)}")
             return {"error": str(e), "confidence_score": 0.0}
     
+    async def extract_business_info_batch(self, html_contents: List[str], sites_per_prompt: int = 4) -> List[Dict[str, Any]]:
+        """
+        Extract business information for several websites with fewer LLM calls.
+        
+        Sites are grouped into numbered blocks, sites_per_prompt at a time, and each
+        group is answered with one JSON array. Groups whose reply cannot be matched
+        back to its sites fall back to one extract_business_info call per site.
+        
+        Args:
+            html_contents: HTML content of each website
+            sites_per_prompt: Maximum number of websites marshaled into one prompt; lowered
+                so a group's reply fits within the model's output token limit
+            
+        Returns:
+            Extracted business information, in input order
+        """
+        sites_per_prompt = max(1, min(sites_per_prompt, self._MAX_OUTPUT_TOKENS // self._EXTRACTION_TOKENS_PER_SITE))
+        groups = [html_contents[i:i + sites_per_prompt] for i in range(0, len(html_contents), sites_per_prompt)]
+        prompts = []
+        for group in groups:
+            sites = "\n\n".join(
+                f"=== SITE {index} ===\n{html_content[:8000]}"
+                for index, html_content in enumerate(group)
+            )
+            prompts.append(f"""
+        Analyze the HTML content of each of the following {len(group)} websites and extract business information.
+        Return a JSON array with exactly {len(group)} objects, where object i describes SITE i, each with the structure:
+
+        {{
+            "business_name": "extracted business name",
+            "contact_info": {{
+                "phone": "phone number if found",
+                "email": "email address if found",
+                "address": "physical address if found"
+            }},
+            "business_hours": "operating hours if found",
+            "services": ["list", "of", "services"],
+            "social_media": {{
+                "facebook": "url if found",
+                "linkedin": "url if found",
+                "twitter": "url if found"
+            }},
+            "confidence_score": 0.95
+        }}
+
+        {sites}
+
+        Respond only with a valid JSON array.
+        """)
+        
+        async def extract_group(prompt: str, group: List[str]) -> List[Dict[str, Any]]:
+            try:
+                response = await self.generate_text(prompt, max_tokens=self._EXTRACTION_TOKENS_PER_SITE * len(group))
+                extracted = json.loads(response)
+                if isinstance(extracted, list) and len(extracted) == len(group):
+                    return extracted
+                self.logger.warning(f"Batched extraction returned {type(extracted).__name__} for {len(group)} sites")
+            except Exception as e:
+                self.logger.error(f"Batched business info extraction error: {str(e)}")
+            return list(await asyncio.gather(*(self.extract_business_info(html_content) for html_content in group)))
+        
+        results = await asyncio.gather(*(extract_group(prompt, group) for prompt, group in zip(prompts, groups)))
+        return [info for group_results in results for info in group_results]
+    
     async def generate_schema_markup(self, business_info: Dict[str, Any], schema_type: str = "LocalBusiness") -> Dict[str, Any]:
         """
         Generate schema markup based on business information.
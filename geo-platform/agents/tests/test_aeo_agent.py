@@ -236,13 +236,13 @@ class TestAEOValidator:
         return AEOValidator(mock_llm_client)
 
     @pytest.mark.asyncio
-    async def test_validate_schema_markup(self, validator, sample_generated_schema):
+    async def test_validate_schema_markup(self, validator, sample_generated_schema, monkeypatch):
         """Test schema markup validation."""
-        validator._llm_validate_schema = AsyncMock(return_value={
+        monkeypatch.setattr(AEOValidator, "_llm_validate_schema", AsyncMock(return_value={
             "has_issues": False,
             "quality_rating": "good",
             "suggestions": []
-        })
+        }))
 
         result = await validator.validate_schema_markup(sample_generated_schema)
 
@@ -251,6 +251,29 @@ class TestAEOValidator:
         assert "completeness_score" in result
         assert "implementation_ready" in result
 
+    @pytest.mark.asyncio
+    async def test_validate_schema_markup_skips_llm_for_invalid_schema(self, validator, mock_llm_client, sample_generated_schema):
+        """Test that schemas failing local validation never reach the LLM."""
+        sample_generated_schema["validation_requirements"] = ["name", "logo"]
+
+        result = await validator.validate_schema_markup(sample_generated_schema)
+
+        assert result["is_valid"] is False
+        assert "llm_feedback" not in result
+        mock_llm_client.generate_text.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_llm_validate_schema_caches_identical_schemas(self, validator, mock_llm_client):
+        """Test repeated LLM reviews of the same schema reuse the cached result."""
+        mock_llm_client.generate_text = AsyncMock(return_value='{"has_issues": false, "suggestions": []}')
+        schema = {"@context": "https://schema.org", "@type": "Organization", "name": "Test"}
+
+        first = await validator._llm_validate_schema(schema, "Organization")
+        second = await validator._llm_validate_schema(dict(reversed(list(schema.items()))), "Organization")
+
+        assert first == second
+        assert mock_llm_client.generate_text.await_count == 1
+
     def test_validate_meta_tags(self, validator):
         """Test meta tags validation."""
         meta_package = {
@@ -325,6 +348,24 @@ class TestAEOValidator:
         assert "implementation_priority" in result
         assert result["readiness_score"] > 0.5
 
+    @pytest.mark.asyncio
+    async def test_is_ready_fast_matches_full_readiness(self, validator):
+        """Test fast readiness check agrees with the full validation."""
+        ready_content = {
+            "schema_validations": {"Organization": {"is_valid": True, "quality_score": 0.8}},
+            "meta_validation": {"is_valid": True}
+        }
+        blocked_content = {
+            "schema_validations": {"Organization": {"is_valid": False, "quality_score": 0.8}},
+            "meta_validation": {"is_valid": False}
+        }
+
+        for content in (ready_content, blocked_content):
+            full = await validator.validate_implementation_readiness(content)
+            assert validator.is_ready_fast(content) == full["ready_for_implementation"]
+
+        assert validator.is_ready_fast(blocked_content) is False
+
     def test_validate_schema_structure(self, validator):
         """Test schema structure validation."""
         good_schema = {
@@ -343,6 +384,20 @@ class TestAEOValidator:
         assert result["structure_valid"] is False
         assert len(result["errors"]) > 0
 
+    def test_validate_requirements(self, validator):
+        """Test requirement checks for plain and 'with at least one' requirements."""
+        requirements = ["name", "mainEntity with at least one question"]
+
+        result = validator._validate_requirements({"name": "Test", "mainEntity": [{"@type": "Question"}]}, requirements)
+        assert result["all_met"] is True
+
+        result = validator._validate_requirements({"name": "", "mainEntity": []}, requirements)
+        assert result["all_met"] is False
+        assert result["missing_requirements"] == [
+            "Missing required property: name",
+            "Missing mainEntity with at least one question"
+        ]
+
     def test_validate_title_tag(self, validator):
         """Test title tag validation."""
         # Good title
@@ -360,6 +415,18 @@ class TestAEOValidator:
         assert len(result["issues"]) > 0
 
 
+    def test_validation_rules_are_read_only(self, validator, mock_llm_client):
+        """Test that the shared validation rules cannot be changed through one validator."""
+        rules = validator.validation_rules
+
+        with pytest.raises(TypeError):
+            rules["meta_tag_limits"]["title_max"] = 70
+        with pytest.raises(AttributeError):
+            rules["schema_required_properties"]["Organization"].append("logo")
+
+        assert AEOValidator(mock_llm_client).validation_rules["meta_tag_limits"]["title_max"] == 60
+
+
 class TestAEOAgent:
     """Test cases for AEOAgent integration."""
 
@@ -369,7 +436,7 @@ class TestAEOAgent:
         return AEOAgent(mock_llm_client)
 
     @pytest.mark.asyncio
-    async def test_analyze_3_phase_pattern(self, aeo_agent, sample_website_data):
+    async def test_analyze_3_phase_pattern(self, aeo_agent, sample_website_data, monkeypatch):
         """Test the complete 3-phase analysis pattern."""
         # Mock the modular components
         aeo_agent.analyzer.analyze_schema_markup = AsyncMock(return_value={"missing_schemas": ["Organization"]})
@@ -382,11 +449,11 @@ class TestAEOAgent:
         aeo_agent.generator.generate_ai_optimization_content = AsyncMock(return_value={"structured_qa_content": {}})
         aeo_agent.generator.generate_content_structure_improvements = MagicMock(return_value={"heading_structure_fixes": []})
 
-        aeo_agent.validator.validate_schema_markup = AsyncMock(return_value={"is_valid": True})
-        aeo_agent.validator.validate_meta_tags = MagicMock(return_value={"is_valid": True})
-        aeo_agent.validator.validate_ai_optimization = MagicMock(return_value={"quality_score": 0.8})
-        aeo_agent.validator.validate_content_structure_improvements = MagicMock(return_value={"implementation_feasibility": 0.9})
-        aeo_agent.validator.validate_implementation_readiness = AsyncMock(return_value={"ready_for_implementation": True, "readiness_score": 0.85})
+        monkeypatch.setattr(AEOValidator, "validate_schema_markup", AsyncMock(return_value={"is_valid": True}))
+        monkeypatch.setattr(AEOValidator, "validate_meta_tags", MagicMock(return_value={"is_valid": True}))
+        monkeypatch.setattr(AEOValidator, "validate_ai_optimization", MagicMock(return_value={"quality_score": 0.8}))
+        monkeypatch.setattr(AEOValidator, "validate_content_structure_improvements", MagicMock(return_value={"implementation_feasibility": 0.9}))
+        monkeypatch.setattr(AEOValidator, "validate_implementation_readiness", AsyncMock(return_value={"ready_for_implementation": True, "readiness_score": 0.85}))
 
         result = await aeo_agent.analyze(sample_website_data)
 
@@ -402,7 +469,7 @@ class TestAEOAgent:
         assert result.metadata["modular_pattern_version"] == "3-phase"
 
     @pytest.mark.asyncio
-    async def test_analyze_with_client_input(self, aeo_agent, sample_website_data, sample_business_info):
+    async def test_analyze_with_client_input(self, aeo_agent, sample_website_data, sample_business_info, monkeypatch):
         """Test analysis with client input data."""
         # Mock the modular components
         aeo_agent.analyzer.analyze_schema_markup = AsyncMock(return_value={"missing_schemas": []})
@@ -414,10 +481,10 @@ class TestAEOAgent:
         aeo_agent.generator.generate_ai_optimization_content = AsyncMock(return_value={})
         aeo_agent.generator.generate_content_structure_improvements = MagicMock(return_value={})
 
-        aeo_agent.validator.validate_meta_tags = MagicMock(return_value={"is_valid": True})
-        aeo_agent.validator.validate_ai_optimization = MagicMock(return_value={"quality_score": 0.8})
-        aeo_agent.validator.validate_content_structure_improvements = MagicMock(return_value={"implementation_feasibility": 0.9})
-        aeo_agent.validator.validate_implementation_readiness = AsyncMock(return_value={"ready_for_implementation": True, "readiness_score": 0.9})
+        monkeypatch.setattr(AEOValidator, "validate_meta_tags", MagicMock(return_value={"is_valid": True}))
+        monkeypatch.setattr(AEOValidator, "validate_ai_optimization", MagicMock(return_value={"quality_score": 0.8}))
+        monkeypatch.setattr(AEOValidator, "validate_content_structure_improvements", MagicMock(return_value={"implementation_feasibility": 0.9}))
+        monkeypatch.setattr(AEOValidator, "validate_implementation_readiness", AsyncMock(return_value={"ready_for_implementation": True, "readiness_score": 0.9}))
 
         client_input = {"business_info": sample_business_info}
         result = await aeo_agent.analyze(sample_website_data, client_input)
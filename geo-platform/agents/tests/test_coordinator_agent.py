@@ -2,16 +2,19 @@
 Tests for CoordinatorAgent and its components.
 """
 
+import functools
 import pytest
 from unittest.mock import AsyncMock, MagicMock
 from datetime import datetime
 
 from src.coordinator_agent.agent import CoordinatorAgent
+from src.coordinator_agent import conflict_resolver as conflict_resolver_module
 from src.coordinator_agent.conflict_resolver import ConflictResolver, ConflictType
 from src.coordinator_agent.prioritizer import Prioritizer
+from src.shared.llm_client import LLMClient
 from src.shared.models import (
     WebsiteData, AgentResponse, AnalysisResult, ConflictResolution,
-    PriorityMatrix, ImplementationPlan, PriorityLevel, ImpactLevel, EffortLevel
+    PriorityMatrix, ImplementationPlan, PriorityLevel, ImpactLevel, EffortLevel, AgentType
 )
 
 
@@ -121,6 +124,40 @@ class TestCoordinatorAgent:
         assert len(resolution_results) == 1
         assert "Resolved" in resolution_results[0].title
 
+    def test_apply_conflict_resolutions_matches_keyword_substrings(self, coordinator_agent):
+        """Test which results a resolution replaces when keywords match inside longer words."""
+        schema_result = AnalysisResult(
+            id="schema1", type="schema_markup", title="FAQ markup", description="Add FAQ entries",
+            priority=PriorityLevel.HIGH, impact=ImpactLevel.HIGH, effort=EffortLevel.LOW,
+            recommendation="Add FAQ schema", confidence=0.8
+        )
+        meta_result = AnalysisResult(
+            id="meta1", type="meta", title="Title tags", description="Follow these recommendations.",
+            priority=PriorityLevel.LOW, impact=ImpactLevel.MEDIUM, effort=EffortLevel.LOW,
+            recommendation="Shorten titles", confidence=0.7
+        )
+        coordinator_agent.agent_responses = {
+            "Agent1": MagicMock(results=[schema_result]),
+            "Agent2": MagicMock(results=[meta_result])
+        }
+        resolutions = [
+            ConflictResolution(
+                conflict_id="overlap_schema_0", conflicting_agents=["Agent1"],
+                conflict_description="Multiple agents addressing schema",
+                resolution_strategy="merge", final_recommendation="Merged", confidence=0.8
+            ),
+            ConflictResolution(
+                conflict_id="priority_mismatch_0", conflicting_agents=["Agent2"],
+                conflict_description="Priority mismatch for similar recommendations: high vs low",
+                resolution_strategy="elevate", final_recommendation="Elevated", confidence=0.8
+            )
+        ]
+
+        unified_results = coordinator_agent._apply_conflict_resolutions([schema_result, meta_result], resolutions)
+
+        # "schema" matches inside "schema_markup"; "recommendations:" keeps its colon and misses
+        assert [r.id for r in unified_results] == ["meta1", "resolved_overlap_schema_0", "resolved_priority_mismatch_0"]
+
     def test_calculate_overall_confidence(self, coordinator_agent, sample_agent_responses):
         """Test overall confidence calculation."""
         # Test with no conflicts
@@ -152,7 +189,7 @@ class TestConflictResolver:
         # Create contradictory agent responses
         contradictory_responses = [
             AgentResponse(
-                agent_name="Agent1", agent_type="test", results=[
+                agent_name="Agent1", agent_type=AgentType.AEO, results=[
                     AnalysisResult(
                         id="test1", type="action", title="Add Feature", description="Add this feature",
                         priority=PriorityLevel.HIGH, impact=ImpactLevel.HIGH, effort=EffortLevel.LOW,
@@ -161,7 +198,7 @@ class TestConflictResolver:
                 ], confidence=0.9, processing_time=1.0, timestamp=datetime.utcnow()
             ),
             AgentResponse(
-                agent_name="Agent2", agent_type="test", results=[
+                agent_name="Agent2", agent_type=AgentType.GEO, results=[
                     AnalysisResult(
                         id="test2", type="action", title="Remove Feature", description="Remove this feature",
                         priority=PriorityLevel.HIGH, impact=ImpactLevel.HIGH, effort=EffortLevel.LOW,
@@ -178,6 +215,108 @@ class TestConflictResolver:
         assert "Agent1" in contradictory_conflicts[0]["agents"]
         assert "Agent2" in contradictory_conflicts[0]["agents"]
 
+    @pytest.fixture
+    def three_agent_responses(self):
+        """Create three agent responses with three results each."""
+        def response(name, agent_type, items):
+            return AgentResponse(
+                agent_name=name, agent_type=agent_type, results=[
+                    AnalysisResult(
+                        id=result_id, type=result_type, title=title, description=title,
+                        priority=priority, impact=ImpactLevel.MEDIUM, effort=EffortLevel.LOW,
+                        recommendation=recommendation, implementation_steps=steps, confidence=0.8
+                    ) for result_id, result_type, title, priority, recommendation, steps in items
+                ], confidence=0.8, processing_time=1.0, timestamp=datetime.utcnow()
+            )
+
+        return [
+            response("AEO Agent", AgentType.AEO, [
+                ("aeo_faq", "schema", "FAQ schema markup", PriorityLevel.HIGH, "Add FAQ schema markup", ["Add FAQPage JSON-LD"]),
+                ("aeo_thin", "content", "Thin content pages", PriorityLevel.MEDIUM, "Hide thin content from the index", []),
+                ("aeo_meta", "meta", "Meta descriptions", PriorityLevel.LOW, "Improve meta descriptions", [])
+            ]),
+            response("GEO Agent", AgentType.GEO, [
+                ("geo_dupe", "schema", "Duplicate schema", PriorityLevel.MEDIUM, "Remove duplicate schema blocks", ["Remove legacy microdata"]),
+                ("geo_hours", "location", "Business hours", PriorityLevel.HIGH, "Display business hours", []),
+                ("geo_meta", "meta", "Meta description", PriorityLevel.HIGH, "Reduce meta description length", [])
+            ]),
+            response("GEO Plus Agent", AgentType.GEO_PLUS, [
+                ("plus_pages", "location", "Location pages", PriorityLevel.LOW, "Create location pages", ["Enable location sitemap"]),
+                ("plus_stale", "content", "Stale listings", PriorityLevel.MEDIUM, "Delete stale listings", ["Disable location sitemap"]),
+                ("plus_reviews", "reviews", "Customer reviews", PriorityLevel.LOW, "Show customer reviews", [])
+            ])
+        ]
+
+    @pytest.mark.asyncio
+    async def test_detect_conflicts_three_agents(self, conflict_resolver, three_agent_responses):
+        """Test conflict ids and result pairs for a three-agent input."""
+        conflicts = await conflict_resolver.detect_conflicts(three_agent_responses)
+
+        # Pairs follow (response i, response j, result in i, result in j) order
+        assert [(c["id"], [r.id for r in c["results"]]) for c in conflicts] == [
+            ("contradiction_0", ["aeo_faq", "geo_dupe"]),
+            ("contradiction_1", ["aeo_thin", "geo_hours"]),
+            ("contradiction_2", ["aeo_meta", "geo_meta"]),
+            ("contradiction_3", ["aeo_faq", "plus_stale"]),
+            ("contradiction_4", ["aeo_thin", "plus_reviews"]),
+            ("contradiction_5", ["geo_dupe", "plus_pages"]),
+            ("overlap_schema_0", ["aeo_faq", "geo_dupe"]),
+            ("overlap_content_1", ["aeo_thin", "plus_stale"]),
+            ("overlap_meta_2", ["aeo_meta", "geo_meta"]),
+            ("overlap_location_3", ["geo_hours", "plus_pages"]),
+            ("priority_mismatch_0", ["aeo_meta", "geo_meta"]),
+            ("implementation_conflict_0", ["aeo_faq", "geo_dupe"])
+        ]
+        assert conflicts[3]["agents"] == ["AEO Agent", "GEO Plus Agent"]
+        assert conflicts[5]["agents"] == ["GEO Agent", "GEO Plus Agent"]
+
+    @pytest.mark.asyncio
+    async def test_detect_conflicts_between_responses_of_one_agent(self, conflict_resolver, three_agent_responses):
+        """Test that two responses sharing an agent name still pair up for contradictions."""
+        first, second, _ = three_agent_responses
+        responses = [first, second.model_copy(update={"agent_name": first.agent_name})]
+
+        conflicts = await conflict_resolver.detect_conflicts(responses)
+
+        # Overlap and implementation conflicts need distinct agent names; pairwise ones do not
+        assert [(c["id"], [r.id for r in c["results"]]) for c in conflicts] == [
+            ("contradiction_0", ["aeo_faq", "geo_dupe"]),
+            ("contradiction_1", ["aeo_thin", "geo_hours"]),
+            ("contradiction_2", ["aeo_meta", "geo_meta"]),
+            ("priority_mismatch_0", ["aeo_meta", "geo_meta"])
+        ]
+
+    @pytest.mark.asyncio
+    async def test_detect_contradictions_with_inflected_keywords(self, conflict_resolver):
+        """Test that keywords still match inside inflected words."""
+        responses = [
+            AgentResponse(
+                agent_name="Agent1", agent_type=AgentType.AEO, results=[
+                    AnalysisResult(
+                        id="test1", type="schema", title="Schema", description="Schema markup",
+                        priority=PriorityLevel.HIGH, impact=ImpactLevel.HIGH, effort=EffortLevel.LOW,
+                        recommendation="Adding FAQ schema markup", confidence=0.9,
+                        implementation_steps=["Enabled breadcrumbs"]
+                    )
+                ], confidence=0.9, processing_time=1.0, timestamp=datetime.utcnow()
+            ),
+            AgentResponse(
+                agent_name="Agent2", agent_type=AgentType.GEO, results=[
+                    AnalysisResult(
+                        id="test2", type="location", title="Location", description="Location pages",
+                        priority=PriorityLevel.HIGH, impact=ImpactLevel.HIGH, effort=EffortLevel.LOW,
+                        recommendation="Removed duplicate markup", confidence=0.8,
+                        implementation_steps=["Disabled breadcrumbs"]
+                    )
+                ], confidence=0.8, processing_time=1.2, timestamp=datetime.utcnow()
+            )
+        ]
+
+        conflicts = await conflict_resolver.detect_conflicts(responses)
+
+        assert [c["id"] for c in conflicts] == ["contradiction_0", "implementation_conflict_0"]
+        assert [r.id for r in conflicts[0]["results"]] == ["test1", "test2"]
+
     @pytest.mark.asyncio
     async def test_detect_overlapping_scope(self, conflict_resolver, sample_agent_responses):
         """Test detection of overlapping scope conflicts."""
@@ -196,7 +335,7 @@ class TestConflictResolver:
         """Test detection of priority mismatches."""
         responses = [
             AgentResponse(
-                agent_name="Agent1", agent_type="test", results=[
+                agent_name="Agent1", agent_type=AgentType.AEO, results=[
                     AnalysisResult(
                         id="test1", type="schema", title="Similar Task", description="Similar description",
                         priority=PriorityLevel.HIGH, impact=ImpactLevel.HIGH, effort=EffortLevel.LOW,
@@ -205,7 +344,7 @@ class TestConflictResolver:
                 ], confidence=0.9, processing_time=1.0, timestamp=datetime.utcnow()
             ),
             AgentResponse(
-                agent_name="Agent2", agent_type="test", results=[
+                agent_name="Agent2", agent_type=AgentType.GEO, results=[
                     AnalysisResult(
                         id="test2", type="schema", title="Similar Task", description="Similar description",
                         priority=PriorityLevel.LOW, impact=ImpactLevel.HIGH, effort=EffortLevel.LOW,
@@ -220,6 +359,45 @@ class TestConflictResolver:
         priority_conflicts = [c for c in conflicts if c["type"] == ConflictType.PRIORITY_MISMATCH]
         assert len(priority_conflicts) >= 1
 
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("use_rapidfuzz", [True, False])
+    async def test_priority_mismatch_uses_difflib_similarity(self, conflict_resolver, monkeypatch, use_rapidfuzz):
+        """Test that the rapidfuzz and difflib paths select the same similar pairs."""
+        if use_rapidfuzz:
+            pytest.importorskip("rapidfuzz")
+        else:
+            monkeypatch.setattr(conflict_resolver_module, "process", None)
+
+        def response(name, agent_type, items, priority):
+            return AgentResponse(
+                agent_name=name, agent_type=agent_type, results=[
+                    AnalysisResult(
+                        id=f"{name}_{index}", type="schema", title=title, description=description,
+                        priority=priority, impact=ImpactLevel.HIGH, effort=EffortLevel.LOW,
+                        recommendation="Review markup", confidence=0.8
+                    ) for index, (title, description) in enumerate(items)
+                ], confidence=0.8, processing_time=1.0, timestamp=datetime.utcnow()
+            )
+
+        # Indel similarity is 0.643 for the shuffled titles, but difflib scores them 0.429
+        responses = [
+            response("Agent1", AgentType.AEO, [
+                ("meta hide title content show", "Ordering of visible sections"),
+                ("Optimize meta descriptions", "Snippet length")
+            ], PriorityLevel.HIGH),
+            response("Agent2", AgentType.GEO, [
+                ("content hide meta title show", "Reviewed by the GEO crawler"),
+                ("Optimise meta description", "Local pack copy")
+            ], PriorityLevel.LOW)
+        ]
+
+        conflicts = await conflict_resolver.detect_conflicts(responses)
+
+        priority_conflicts = [c for c in conflicts if c["type"] == ConflictType.PRIORITY_MISMATCH]
+        assert [(c["id"], [r.id for r in c["results"]]) for c in priority_conflicts] == [
+            ("priority_mismatch_0", ["Agent1_1", "Agent2_1"])
+        ]
+
     @pytest.mark.asyncio
     async def test_resolve_contradictory_recommendations(self, conflict_resolver, sample_website_data):
         """Test resolution of contradictory recommendations."""
@@ -274,6 +452,80 @@ class TestConflictResolver:
         assert resolution.resolution_strategy == "Priority elevation"
         assert "high" in resolution.final_recommendation.lower()
 
+    @pytest.mark.asyncio
+    async def test_resolve_conflicts_batches_llm_calls(self, conflict_resolver, sample_website_data):
+        """Test that contradictory conflicts share one batched LLM request."""
+        results = [
+            AnalysisResult(
+                id="test1", type="action", title="Add", description="Add feature",
+                priority=PriorityLevel.HIGH, impact=ImpactLevel.HIGH, effort=EffortLevel.LOW,
+                recommendation="Add schema", confidence=0.9
+            ),
+            AnalysisResult(
+                id="test2", type="action", title="Remove", description="Remove feature",
+                priority=PriorityLevel.HIGH, impact=ImpactLevel.HIGH, effort=EffortLevel.LOW,
+                recommendation="Remove schema", confidence=0.8
+            )
+        ]
+        conflicts = [{
+            "id": f"contradiction_{i}",
+            "type": ConflictType.CONTRADICTORY_RECOMMENDATIONS,
+            "agents": ["Agent1", "Agent2"],
+            "results": results,
+            "description": "Contradictory recommendations between Agent1 and Agent2"
+        } for i in range(3)]
+
+        conflict_resolver.llm_client.generate_text_batch = AsyncMock(return_value=["first", "second", "third"])
+
+        resolutions = await conflict_resolver.resolve_conflicts(conflicts, sample_website_data)
+
+        conflict_resolver.llm_client.generate_text_batch.assert_awaited_once()
+        assert [r.final_recommendation for r in resolutions] == ["first", "second", "third"]
+
+        # Fall back to rule-based resolution when the batch fails
+        conflict_resolver.llm_client.generate_text_batch = AsyncMock(side_effect=Exception("LLM down"))
+
+        resolutions = await conflict_resolver.resolve_conflicts(conflicts, sample_website_data)
+
+        assert len(resolutions) == 3
+        assert all("Add schema" in r.final_recommendation for r in resolutions)
+
+    @pytest.mark.asyncio
+    async def test_resolve_conflicts_falls_back_per_failed_prompt(self, conflict_resolver, sample_website_data):
+        """Test that one failed prompt only falls back for its own conflict."""
+        results = [
+            AnalysisResult(
+                id="test1", type="action", title="Add", description="Add feature",
+                priority=PriorityLevel.HIGH, impact=ImpactLevel.HIGH, effort=EffortLevel.LOW,
+                recommendation="Add schema", confidence=0.9
+            ),
+            AnalysisResult(
+                id="test2", type="action", title="Remove", description="Remove feature",
+                priority=PriorityLevel.HIGH, impact=ImpactLevel.HIGH, effort=EffortLevel.LOW,
+                recommendation="Remove schema", confidence=0.8
+            )
+        ]
+        conflicts = [{
+            "id": f"contradiction_{i}",
+            "type": ConflictType.CONTRADICTORY_RECOMMENDATIONS,
+            "agents": ["Agent1", "Agent2"],
+            "results": results,
+            "description": "Contradictory recommendations between Agent1 and Agent2"
+        } for i in range(3)]
+
+        # Run the real batch helper over a generate_text whose second call fails
+        llm_client = conflict_resolver.llm_client
+        llm_client.generate_text = AsyncMock(side_effect=["first", Exception("rate limited"), "third"])
+        llm_client.generate_text_batch = functools.partial(LLMClient.generate_text_batch, llm_client)
+
+        resolutions = await conflict_resolver.resolve_conflicts(conflicts, sample_website_data)
+
+        assert llm_client.generate_text.await_count == 3
+        assert [r.conflict_id for r in resolutions] == ["contradiction_0", "contradiction_1", "contradiction_2"]
+        assert resolutions[0].final_recommendation == "first"
+        assert "Add schema" in resolutions[1].final_recommendation
+        assert resolutions[2].final_recommendation == "third"
+
 
 class TestPrioritizer:
     """Test cases for Prioritizer."""
@@ -0,0 +1,216 @@
+"""
+Tests for GEO Agent and its components.
+"""
+
+import pytest
+import json
+import re
+from unittest.mock import AsyncMock
+from bs4 import BeautifulSoup
+
+from src.geo_agent.agent import GEOAgent, DomCache
+from src.geo_agent.analyzer import GEOAnalyzer
+from src.shared.llm_client import LLMClient
+from src.shared.models import WebsiteData
+
+
+_SITE_RE = re.compile(r"<html>(site-\d+)</html>")
+
+
+def _site_names(prompt):
+    """Return the site markers embedded in a prompt, in order."""
+    return _SITE_RE.findall(prompt)
+
+
+class TestBusinessInfoBatch:
+    """Test cases for batched business information extraction."""
+
+    @pytest.fixture
+    def llm_client(self):
+        """Create an LLM client whose requests are mocked."""
+        return LLMClient(api_key="test-key")
+
+    @pytest.fixture
+    def html_contents(self):
+        """HTML for six distinguishable websites."""
+        return [f"<html>site-{index}</html>" for index in range(6)]
+
+    @pytest.mark.asyncio
+    async def test_extract_batch_parses_json_array(self, llm_client, html_contents):
+        """Test that each group is answered by one JSON array, in site order."""
+        async def generate_text(prompt, **kwargs):
+            return json.dumps([{"business_name": name} for name in _site_names(prompt)])
+        llm_client.generate_text = AsyncMock(side_effect=generate_text)
+
+        results = await llm_client.extract_business_info_batch(html_contents, sites_per_prompt=3)
+
+        assert [r["business_name"] for r in results] == [f"site-{index}" for index in range(6)]
+        assert llm_client.generate_text.await_count == 2
+        assert all(call.kwargs["max_tokens"] == 6000 for call in llm_client.generate_text.await_args_list)
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("batched_reply", [
+        '[{"business_name": "only one"}]',
+        'Here are the results: not JSON'
+    ])
+    async def test_extract_batch_falls_back_per_site(self, llm_client, html_contents, batched_reply):
+        """Test that a group with a wrong-length or unparseable reply is retried site by site."""
+        async def generate_text(prompt, **kwargs):
+            names = _site_names(prompt)
+            if len(names) > 1:
+                return batched_reply
+            return json.dumps({"business_name": names[0]})
+        llm_client.generate_text = AsyncMock(side_effect=generate_text)
+
+        results = await llm_client.extract_business_info_batch(html_contents, sites_per_prompt=3)
+
+        assert [r["business_name"] for r in results] == [f"site-{index}" for index in range(6)]
+        assert llm_client.generate_text.await_count == 2 + 6
+
+    @pytest.mark.asyncio
+    async def test_extract_batch_caps_output_tokens(self, llm_client, html_contents):
+        """Test that groups shrink so max_tokens stays within the model's output limit."""
+        async def generate_text(prompt, **kwargs):
+            return json.dumps([{"business_name": name} for name in _site_names(prompt)])
+        llm_client.generate_text = AsyncMock(side_effect=generate_text)
+
+        results = await llm_client.extract_business_info_batch(html_contents, sites_per_prompt=10)
+
+        assert len(results) == 6
+        max_tokens = [call.kwargs["max_tokens"] for call in llm_client.generate_text.await_args_list]
+        assert max(max_tokens) <= LLMClient._MAX_OUTPUT_TOKENS
+        assert max_tokens == [8000, 4000]
+
+
+class TestGEOAgentBatch:
+    """Test cases for GEOAgent.analyze_batch."""
+
+    @pytest.mark.asyncio
+    async def test_analyze_batch_matches_sequential_legacy(self, sample_website_data, monkeypatch):
+        """Test that process-pool batch results match sequential analyze_legacy."""
+        # Spawned workers read their credentials from the environment
+        monkeypatch.setenv("ANTHROPIC_API_KEY", "test-key")
+        agent = GEOAgent(LLMClient())
+        websites = [
+            sample_website_data,
+            WebsiteData(
+                url="https://www.other-example.com",
+                html_content="""
+                <html><head><title>Other Example | Plumbing</title></head>
+                <body>
+                    <header><a href="tel:+15559876543">Call us</a></header>
+                    <p>Reach us at info@other-example.com or 555-987-6543.</p>
+                    <p>Visit 9 Oak Ave, Springfield, IL 62701</p>
+                    <footer><a href="https://www.facebook.com/otherexample">Facebook</a></footer>
+                </body></html>
+                """
+            )
+        ]
+
+        batch = await agent.analyze_batch(websites, max_workers=2)
+        sequential = [await agent.analyze_legacy(website_data) for website_data in websites]
+
+        assert len(batch) == len(websites)
+        assert all(response.results for response in batch)
+        for batch_response, sequential_response in zip(batch, sequential):
+            assert [r.model_dump() for r in batch_response.results] == [r.model_dump() for r in sequential_response.results]
+            assert batch_response.metadata == sequential_response.metadata
+            assert batch_response.confidence == sequential_response.confidence
+
+
+    @pytest.mark.asyncio
+    async def test_analyze_legacy_reports_unreadable_page(self):
+        """Test that a page without HTML yields an error response instead of raising."""
+        agent = GEOAgent(LLMClient(api_key="test-key"))
+        website_data = WebsiteData.model_construct(url="https://example.com", html_content=None)
+
+        response = await agent.analyze_legacy(website_data)
+
+        assert response.confidence == 0.0
+        assert len(response.results) == 1
+        assert agent._analysis_cache == {}
+
+
+class TestGEOAgentExtraction:
+    """Test cases for GEOAgent business information extraction."""
+
+    @pytest.fixture
+    def geo_agent(self):
+        """Create GEOAgent instance."""
+        return GEOAgent(LLMClient(api_key="test-key"))
+
+    def _extract(self, geo_agent, html, url="https://example.com"):
+        """Run business information extraction over raw HTML."""
+        website_data = WebsiteData(url=url, html_content=html)
+        return geo_agent._extract_business_information(DomCache.from_soup(BeautifulSoup(html, "html.parser")), website_data)
+
+    def test_social_links_use_platform_priority(self, geo_agent):
+        """Test that hrefs naming several hosts are filed under the highest-priority platform."""
+        html = """
+        <html><body>
+            <a href="https://www.facebook.com/sharer?u=https://linkedin.com/company/example">Share</a>
+            <a href="https://x.com/share?url=https://instagram.com/example">Post</a>
+            <a href="https://twitter.com/example">Twitter</a>
+        </body></html>
+        """
+
+        business_info = self._extract(geo_agent, html)
+
+        assert business_info.social_media == {
+            "linkedin": "https://www.facebook.com/sharer?u=https://linkedin.com/company/example",
+            "instagram": "https://x.com/share?url=https://instagram.com/example",
+            "twitter": "https://twitter.com/example"
+        }
+
+
+    @pytest.mark.parametrize("url", ["https://www.example.com", "https://example.com"])
+    def test_business_name_falls_back_to_domain(self, geo_agent, url):
+        """Test that the domain fallback ignores a leading www. label."""
+        business_info = self._extract(geo_agent, "<html><body><p>Welcome</p></body></html>", url=url)
+
+        assert business_info.name == "Example"
+
+
+class TestGEOAnalyzerNAP:
+    """Test cases for GEOAnalyzer NAP consistency scoring."""
+
+    @pytest.fixture
+    def analyzer(self):
+        """Create GEOAnalyzer instance."""
+        return GEOAnalyzer(LLMClient(api_key="test-key"))
+
+    def _analyze(self, analyzer, html):
+        """Run NAP consistency analysis over raw HTML."""
+        return analyzer._analyze_nap_consistency(WebsiteData(url="https://example.com", html_content=html))
+
+    def test_formatting_differences_are_consistent(self, analyzer):
+        """Test that one phone number written in two formats counts as a single value."""
+        html = """
+        <html><body>
+            <header>Call (555) 123-4567</header>
+            <footer>Phone 555.123.4567</footer>
+        </body></html>
+        """
+
+        nap = self._analyze(analyzer, html)
+
+        assert nap["phone_variations"] == ["(555) 123-4567", "555.123.4567"]
+        assert nap["consistency_score"] == 1.0
+        assert nap["inconsistencies"] == []
+
+    def test_conflicting_phone_numbers_are_reported(self, analyzer):
+        """Test that a second phone number lowers the score and is reported against the most common one."""
+        html = """
+        <html><body>
+            <header>Call (555) 123-4567</header>
+            <footer>Phone (555) 987-6543</footer>
+            <div class="contact">Call 555-123-4567</div>
+        </body></html>
+        """
+
+        nap = self._analyze(analyzer, html)
+
+        assert nap["consistency_score"] == pytest.approx((1.0 + 1.0 + 0.7) / 3)
+        assert nap["inconsistencies"] == [
+            {"field": "phone", "canonical": "(555) 123-4567", "variants": ["(555) 987-6543"]}
+        ]